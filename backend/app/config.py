@@ -8,12 +8,84 @@ class Config:
     DB_USER = os.getenv('DB_USER')
     DB_PASSWORD = os.getenv('DB_PASSWORD')
 
+    # Database connection pool configuration
+    DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+    DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 5))  # seconds to wait for a free connection
+    DB_POOL_MAX_IDLE = float(os.getenv('DB_POOL_MAX_IDLE', 300))  # seconds before an idle connection is evicted
+    DB_POOL_MAX_LIFETIME = float(os.getenv('DB_POOL_MAX_LIFETIME', 3600))  # seconds before a connection is recycled
+    DB_POOL_PING_INTERVAL = float(os.getenv('DB_POOL_PING_INTERVAL', 5))  # ping connections idle longer than this
+
+    # Database instrumentation
+    DB_SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', 200))  # 0 disables the slow-query log
+
+    # Write-behind buffer for view events
+    VIEW_WRITER_BATCH_SIZE = int(os.getenv('VIEW_WRITER_BATCH_SIZE', 500))
+    VIEW_WRITER_FLUSH_INTERVAL = float(os.getenv('VIEW_WRITER_FLUSH_INTERVAL', 1.0))  # seconds
+    VIEW_WRITER_MAX_QUEUE = int(os.getenv('VIEW_WRITER_MAX_QUEUE', 10000))
+    VIEW_WRITER_ENQUEUE_TIMEOUT = float(os.getenv('VIEW_WRITER_ENQUEUE_TIMEOUT', 0.05))  # seconds before rejecting
+    VIEW_WRITER_RETRY_ATTEMPTS = int(os.getenv('VIEW_WRITER_RETRY_ATTEMPTS', 5))  # retries of a batch on connection errors
+    VIEW_WRITER_RETRY_BACKOFF = float(os.getenv('VIEW_WRITER_RETRY_BACKOFF', 0.5))  # seconds, doubled per retry
+
+    # Bulk endpoints
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 500))
+
     # External API configuration
     EXTERNAL_API_URL = os.getenv('EXTERNAL_API_URL')
     EXTERNAL_API_KEY = os.getenv('EXTERNAL_API_KEY')
     
     # YouTube API configuration
     YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY')
+    YOUTUBE_CONNECT_TIMEOUT = float(os.getenv('YOUTUBE_CONNECT_TIMEOUT', 3.05))  # seconds
+    YOUTUBE_READ_TIMEOUT = float(os.getenv('YOUTUBE_READ_TIMEOUT', 10))  # seconds
+    YOUTUBE_MAX_RETRIES = int(os.getenv('YOUTUBE_MAX_RETRIES', 3))
+    YOUTUBE_RETRY_BACKOFF = float(os.getenv('YOUTUBE_RETRY_BACKOFF', 0.5))  # exponential backoff factor, seconds
+    YOUTUBE_MAX_RETRY_AFTER = float(os.getenv('YOUTUBE_MAX_RETRY_AFTER', 5))  # cap on honoured Retry-After, seconds
+    # Keep-alive connections per host; size it to the number of request threads per worker
+    YOUTUBE_POOL_MAXSIZE = int(os.getenv('YOUTUBE_POOL_MAXSIZE', 10))
+    
+    # YouTube response cache (per-endpoint TTLs in seconds)
+    YOUTUBE_CACHE_TTL_SEARCH = int(os.getenv('YOUTUBE_CACHE_TTL_SEARCH', 900))
+    YOUTUBE_CACHE_TTL_VIDEO = int(os.getenv('YOUTUBE_CACHE_TTL_VIDEO', 3600))
+    YOUTUBE_CACHE_TTL_TRENDING = int(os.getenv('YOUTUBE_CACHE_TTL_TRENDING', 600))
+    YOUTUBE_CACHE_TTL_CATEGORIES = int(os.getenv('YOUTUBE_CACHE_TTL_CATEGORIES', 86400))
+    YOUTUBE_CACHE_MAX_ENTRIES = int(os.getenv('YOUTUBE_CACHE_MAX_ENTRIES', 10000))
+    YOUTUBE_CACHE_MAX_BYTES = int(os.getenv('YOUTUBE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    # Shared trending_videos_cache table, read by every worker before calling YouTube
+    TRENDING_DB_CACHE_TTL = int(os.getenv('TRENDING_DB_CACHE_TTL', 900))
+    # Concurrent upstream calls when a batch lookup spans several 50-id chunks
+    YOUTUBE_BATCH_CONCURRENCY = int(os.getenv('YOUTUBE_BATCH_CONCURRENCY', 4))
+    # Upper bound on max_results for the public listings; each search page costs 100 quota units
+    YOUTUBE_MAX_RESULTS = int(os.getenv('YOUTUBE_MAX_RESULTS', 100))
+    
+    # Recommendation search fan-out: worker threads shared by all requests and per-request deadline (seconds)
+    RECOMMENDATION_FANOUT_WORKERS = int(os.getenv('RECOMMENDATION_FANOUT_WORKERS', 8))
+    RECOMMENDATION_DEADLINE = float(os.getenv('RECOMMENDATION_DEADLINE', 2.5))
+    # Local content index used to rank recommendation candidates
+    CONTENT_INDEX_MAX_VIDEOS = int(os.getenv('CONTENT_INDEX_MAX_VIDEOS', 20000))
+    # Per-user interest profiles: weight half-life and how many terms are kept per user
+    INTEREST_HALF_LIFE_DAYS = float(os.getenv('INTEREST_HALF_LIFE_DAYS', 14))
+    INTEREST_MAX_STORED_TERMS = int(os.getenv('INTEREST_MAX_STORED_TERMS', 200))
+    # Precomputed per-user recommendations
+    RECOMMENDATION_CACHE_TTL = int(os.getenv('RECOMMENDATION_CACHE_TTL', 900))
+    RECOMMENDATION_CACHE_MAX_USERS = int(os.getenv('RECOMMENDATION_CACHE_MAX_USERS', 10000))
+    RECOMMENDATION_CACHE_MAX_BYTES = int(os.getenv('RECOMMENDATION_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+    # Per-user sets of watched video ids excluded from recommendations
+    SEEN_VIDEOS_CACHE_TTL = int(os.getenv('SEEN_VIDEOS_CACHE_TTL', 3600))
+    SEEN_VIDEOS_CACHE_MAX_USERS = int(os.getenv('SEEN_VIDEOS_CACHE_MAX_USERS', 10000))
+    SEEN_VIDEOS_CACHE_MAX_BYTES = int(os.getenv('SEEN_VIDEOS_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+    
+    # YouTube daily quota budget (units) and the usage ratios that switch modes
+    YOUTUBE_DAILY_QUOTA = int(os.getenv('YOUTUBE_DAILY_QUOTA', 10000))
+    YOUTUBE_QUOTA_DEGRADED_RATIO = float(os.getenv('YOUTUBE_QUOTA_DEGRADED_RATIO', 0.8))
+    YOUTUBE_QUOTA_CACHE_ONLY_RATIO = float(os.getenv('YOUTUBE_QUOTA_CACHE_ONLY_RATIO', 0.95))
+    YOUTUBE_QUOTA_SYNC_INTERVAL = float(os.getenv('YOUTUBE_QUOTA_SYNC_INTERVAL', 10))
+    
+    # YouTube resilience: circuit breaker per endpoint type and how long expired
+    # responses may still be served stale while refreshing or during an outage
+    YOUTUBE_BREAKER_FAILURE_THRESHOLD = int(os.getenv('YOUTUBE_BREAKER_FAILURE_THRESHOLD', 5))
+    YOUTUBE_BREAKER_RESET_TIMEOUT = float(os.getenv('YOUTUBE_BREAKER_RESET_TIMEOUT', 30))
+    YOUTUBE_CACHE_STALE_TTL = int(os.getenv('YOUTUBE_CACHE_STALE_TTL', 6 * 3600))
     
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'your-secret-key-change-in-production')
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from typing import Generic, List, Optional, Dict, Any, TypeVar, Union
+
+T = TypeVar('T')
 
 @dataclass
 class User:
@@ -80,6 +82,18 @@ class TrendAnalysis:
     results: Dict[str, Any]  # JSON with statistics and videos
     criteria: Dict[str, Any] = field(default_factory=dict)
 
+@dataclass
+class TrendAnalysisSummary:
+    """TrendAnalysis without the results blob, for listings"""
+    id: int
+    user_id: int
+    category: str
+    region: str
+    analyzed_at: datetime
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    total_videos: int = 0
+    criteria: Dict[str, Any] = field(default_factory=dict)
+
 @dataclass
 class ViewHistory:
     id: int
@@ -99,4 +113,15 @@ class UserPreferences:
     languages: List[str]
     min_duration: Optional[int] = None  # in seconds
     max_duration: Optional[int] = None  # in seconds
-    updated_at: datetime = field(default_factory=datetime.now) 
\ No newline at end of file
+    updated_at: datetime = field(default_factory=datetime.now)
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None  # Opaque keyset token for the next page, None on the last page
+
+@dataclass
+class StoredRecommendations:
+    videos: List[Dict[str, Any]]
+    max_results: int  # how many were asked for when generating; smaller requests are served by slicing
+    generated_at: datetime
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from .models import StoredRecommendations
+
+class VideoIndex(ABC):
+    @abstractmethod
+    def add_videos(self, videos: Iterable[Dict[str, Any]]) -> int:
+        pass
+    
+    @abstractmethod
+    def search(self, profile: Dict[str, float], limit: int,
+               exclude: Optional[Set[str]] = None) -> List[Tuple[Dict[str, Any], float]]:
+        pass
+    
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        pass
+
+class RecommendationCache(ABC):
+    @abstractmethod
+    def get(self, user_id: int) -> Optional[StoredRecommendations]:
+        pass
+    
+    @abstractmethod
+    def put(self, user_id: int, videos: List[Dict[str, Any]], max_results: int) -> StoredRecommendations:
+        pass
+    
+    @abstractmethod
+    def invalidate(self, user_id: int) -> None:
+        pass
+
+class SeenVideosStore(ABC):
+    @abstractmethod
+    def get(self, user_id: int) -> FrozenSet[str]:
+        pass
+    
+    @abstractmethod
+    def add(self, user_id: int, video_ids: Iterable[str]) -> None:
+        pass
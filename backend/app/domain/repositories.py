@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from .models import User, FavoriteVideo, TrendAnalysis, ViewHistory, UserPreferences
+from datetime import date, datetime
+from typing import Iterator, List, Optional, Dict, Any, Set, Tuple
+from .models import User, FavoriteVideo, TrendAnalysis, TrendAnalysisSummary, ViewHistory, UserPreferences, Page
 
 class UserRepository(ABC):
     @abstractmethod
@@ -19,6 +20,14 @@ class UserRepository(ABC):
     def get_all(self) -> List[User]:
         pass
     
+    @abstractmethod
+    def iter_all(self) -> Iterator[User]:
+        pass
+    
+    @abstractmethod
+    def get_page(self, limit: int, cursor: Optional[str] = None) -> Page[User]:
+        pass
+    
     @abstractmethod
     def search_by_name(self, name: str) -> List[User]:
         pass
@@ -36,6 +45,10 @@ class FavoriteVideoRepository(ABC):
     def create(self, video: FavoriteVideo) -> FavoriteVideo:
         pass
     
+    @abstractmethod
+    def create_many(self, videos: List[FavoriteVideo]) -> List[bool]:
+        pass
+    
     @abstractmethod
     def get_by_id(self, video_id: int) -> Optional[FavoriteVideo]:
         pass
@@ -44,6 +57,10 @@ class FavoriteVideoRepository(ABC):
     def get_by_user(self, user_id: int) -> List[FavoriteVideo]:
         pass
     
+    @abstractmethod
+    def get_page_by_user(self, user_id: int, limit: int, cursor: Optional[str] = None) -> Page[FavoriteVideo]:
+        pass
+    
     @abstractmethod
     def get_by_youtube_id(self, user_id: int, youtube_video_id: str) -> Optional[FavoriteVideo]:
         pass
@@ -52,9 +69,21 @@ class FavoriteVideoRepository(ABC):
     def update(self, video: FavoriteVideo) -> FavoriteVideo:
         pass
     
+    @abstractmethod
+    def update_many(self, videos: List[FavoriteVideo]) -> int:
+        pass
+    
     @abstractmethod
     def delete(self, video_id: int) -> bool:
         pass
+    
+    @abstractmethod
+    def delete_by_user_and_video(self, user_id: int, youtube_video_id: str) -> bool:
+        pass
+    
+    @abstractmethod
+    def delete_many_by_user_and_videos(self, user_id: int, youtube_video_ids: List[str]) -> int:
+        pass
 
 class TrendAnalysisRepository(ABC):
     @abstractmethod
@@ -69,6 +98,15 @@ class TrendAnalysisRepository(ABC):
     def get_by_user(self, user_id: int) -> List[TrendAnalysis]:
         pass
     
+    @abstractmethod
+    def iter_summaries_by_user(self, user_id: int) -> Iterator[TrendAnalysisSummary]:
+        pass
+    
+    @abstractmethod
+    def get_summary_page_by_user(self, user_id: int, limit: int,
+                                 cursor: Optional[str] = None) -> Page[TrendAnalysisSummary]:
+        pass
+    
     @abstractmethod
     def update(self, analysis: TrendAnalysis) -> TrendAnalysis:
         pass
@@ -86,6 +124,31 @@ class ViewHistoryRepository(ABC):
     def get_by_user(self, user_id: int) -> List[ViewHistory]:
         pass
     
+    @abstractmethod
+    def iter_by_user(self, user_id: int) -> Iterator[ViewHistory]:
+        pass
+    
+    @abstractmethod
+    def get_page_by_user(self, user_id: int, limit: int, cursor: Optional[str] = None) -> Page[ViewHistory]:
+        pass
+    
+    @abstractmethod
+    def get_by_user_in_range(self, user_id: int, since: Optional[datetime] = None,
+                             until: Optional[datetime] = None) -> List[ViewHistory]:
+        pass
+    
+    @abstractmethod
+    def get_recent_by_user(self, user_id: int, limit: int) -> List[ViewHistory]:
+        pass
+    
+    @abstractmethod
+    def get_video_ids_by_user(self, user_id: int) -> Set[str]:
+        pass
+    
+    @abstractmethod
+    def create_many(self, histories: List[ViewHistory]) -> int:
+        pass
+    
     @abstractmethod
     def update(self, history: ViewHistory) -> ViewHistory:
         pass
@@ -109,4 +172,35 @@ class UserPreferencesRepository(ABC):
     
     @abstractmethod
     def delete(self, preferences_id: int) -> bool:
-        pass 
\ No newline at end of file
+        pass
+
+class TrendingVideosCacheRepository(ABC):
+    @abstractmethod
+    def get_fresh(self, region_code: str, category_id: int, limit: int, max_age: int) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        pass
+    
+    @abstractmethod
+    def replace(self, region_code: str, category_id: int, videos: List[Dict[str, Any]]) -> int:
+        pass
+
+class YouTubeQuotaRepository(ABC):
+    @abstractmethod
+    def add_usage(self, usage: Dict[Tuple[date, str, int], int]) -> None:
+        pass
+    
+    @abstractmethod
+    def get_usage(self, quota_date: date) -> List[Dict[str, Any]]:
+        pass
+
+class UserInterestRepository(ABC):
+    @abstractmethod
+    def add_weights(self, increments: Dict[Tuple[int, str], float]) -> None:
+        pass
+    
+    @abstractmethod
+    def get_top_terms(self, user_id: int, limit: int) -> List[Tuple[str, float]]:
+        pass
+    
+    @abstractmethod
+    def prune(self, user_id: int, keep: int) -> int:
+        pass
@@ -0,0 +1,43 @@
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+# English and Spanish function words that carry no topical signal
+STOP_WORDS = frozenset("""
+the and for with from this that are was were you your our not but all any can has have had its into out
+about what when how who why will just more most new vs official video videos full hd
+los las una uno unos unas del por para con sin sus que como mas pero muy este esta estos estas ese esa
+son fue ser hay todo todos nos les ella ellos
+""".split())
+
+# How much each field counts towards a video's term weights
+FIELD_WEIGHTS = (
+    ('title', 3.0),
+    ('tags', 2.0),
+    ('channel_title', 2.0),
+    ('description', 1.0)
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens without stop words, numbers or very short words"""
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 2 and token not in STOP_WORDS and not token.isdigit()
+    ]
+
+
+def video_terms(video: Dict[str, Any]) -> Counter:
+    """Field-weighted term counts of a formatted video dict"""
+    terms: Counter = Counter()
+    for field, weight in FIELD_WEIGHTS:
+        value = video.get(field)
+        if field == 'tags':
+            value = ' '.join(value or [])
+        for token in tokenize(value):
+            terms[token] += weight
+    return terms
@@ -0,0 +1,74 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    are rejected for ``reset_timeout`` seconds. Then a single trial call is let
+    through (half-open): success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self._counters = {'rejected': 0, 'opened': 0}
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now; a True in half-open state reserves the trial call"""
+        with self._lock:
+            if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = STATE_HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._counters['rejected'] += 1
+            return False
+
+    def release(self) -> None:
+        """Give back a reserved half-open trial when the call was not made after all"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = STATE_CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != STATE_OPEN:
+                    self._counters['opened'] += 1
+                self._state = STATE_OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._state == STATE_OPEN and time.monotonic() - self._opened_at < self.reset_timeout
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._counters, state=self._state, consecutive_failures=self._failures)
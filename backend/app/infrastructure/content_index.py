@@ -0,0 +1,94 @@
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from ..domain.ports import VideoIndex
+from ..domain.terms import video_terms
+
+
+class ContentIndex(VideoIndex):
+    """In-memory TF-IDF index over the videos the app has already seen.
+
+    Documents are stored as sparse, length-normalized sublinear term
+    frequencies in an inverted index (term -> {video_id: weight}); IDF is
+    applied at query time, so adding a document never rescales the others.
+    The index keeps at most ``max_documents`` videos, evicting the least
+    recently added one.
+    """
+
+    def __init__(self, max_documents: int = 20000, max_description_chars: int = 500):
+        self.max_documents = max_documents
+        self.max_description_chars = max_description_chars
+        self._documents: 'OrderedDict[str, Dict[str, float]]' = OrderedDict()
+        self._videos: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.RLock()
+
+    def add_videos(self, videos: Iterable[Dict[str, Any]]) -> int:
+        """Index (or re-index) formatted video dicts; returns how many were indexed"""
+        added = 0
+        with self._lock:
+            for video in videos:
+                video_id = video.get('video_id') if video else None
+                if not video_id:
+                    continue
+                terms = video_terms(video)
+                if not terms:
+                    continue
+                self._remove(video_id)
+                # Field weights keep every count >= 1, so the log term is never negative
+                weights = {term: 1 + math.log(count) for term, count in terms.items()}
+                norm = math.sqrt(sum(weight * weight for weight in weights.values()))
+                document = {term: weight / norm for term, weight in weights.items()}
+                self._documents[video_id] = document
+                self._videos[video_id] = self._compact(video)
+                for term, weight in document.items():
+                    self._postings.setdefault(term, {})[video_id] = weight
+                added += 1
+            while len(self._documents) > self.max_documents:
+                self._remove(next(iter(self._documents)))
+        return added
+
+    def search(self, profile: Dict[str, float], limit: int,
+               exclude: Optional[Set[str]] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Rank indexed videos by TF-IDF similarity to a term -> weight profile"""
+        exclude = exclude or set()
+        with self._lock:
+            total = len(self._documents)
+            scores: Dict[str, float] = {}
+            for term, weight in profile.items():
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log((1 + total) / (1 + len(postings))) + 1
+                for video_id, doc_weight in postings.items():
+                    scores[video_id] = scores.get(video_id, 0.0) + weight * idf * doc_weight
+            ranked = sorted(
+                (item for item in scores.items() if item[0] not in exclude),
+                key=lambda item: item[1],
+                reverse=True
+            )[:limit]
+            return [(dict(self._videos[video_id]), score) for video_id, score in ranked]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'documents': len(self._documents), 'terms': len(self._postings)}
+
+    def _compact(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        # Long descriptions only matter for indexing; keep what a result card needs
+        compact = dict(video)
+        if isinstance(compact.get('description'), str):
+            compact['description'] = compact['description'][:self.max_description_chars]
+        return compact
+
+    def _remove(self, video_id: str) -> None:
+        document = self._documents.pop(video_id, None)
+        self._videos.pop(video_id, None)
+        if document is None:
+            return
+        for term in document:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(video_id, None)
+                if not postings:
+                    del self._postings[term]
@@ -1,40 +1,433 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
 import pymysql
-from pymysql.cursors import DictCursor
+from pymysql.constants import SERVER_STATUS
+from pymysql.cursors import DictCursor, SSCursor, SSDictCursor
 from ..config import Config
+from .metrics import database_metrics
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available within the checkout timeout"""
+
+
+class InstrumentedCursor:
+    """Cursor wrapper that times every statement and records it under the caller's tag"""
+
+    def __init__(self, cursor: Any, tag: str):
+        self._cursor = cursor
+        self._tag = tag
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __enter__(self) -> 'InstrumentedCursor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._cursor.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, query: str, args: Any = None) -> int:
+        return self._timed(self._cursor.execute, query, args)
+
+    def executemany(self, query: str, args: Any) -> int:
+        return self._timed(self._cursor.executemany, query, args)
+
+    def _timed(self, method: Callable, query: str, args: Any) -> int:
+        started = time.perf_counter()
+        try:
+            result = method(query, args)
+        except Exception:
+            database_metrics.record_query(self._tag, query, (time.perf_counter() - started) * 1000, 0, error=True)
+            raise
+        # Unbuffered cursors report rows as they are fetched (see DatabaseConnection.stream)
+        rows = 0 if isinstance(self._cursor, SSCursor) else self._cursor.rowcount or 0
+        database_metrics.record_query(self._tag, query, (time.perf_counter() - started) * 1000, rows)
+        return result
+
+
+class PooledConnection:
+    """Connection handed out by the pool.
+
+    Behaves like a pymysql connection, but close() returns it to the pool so the
+    repositories keep their existing open/close pattern without paying a new
+    TCP and auth handshake per query.
+    """
+
+    def __init__(self, pool: 'ConnectionPool', raw: pymysql.connections.Connection, created_at: float):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+        self._released = False
+        self.tag = 'unknown'
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def cursor(self, cursor: Any = None) -> InstrumentedCursor:
+        return InstrumentedCursor(self._raw.cursor(cursor), self.tag)
+
+    def close(self) -> None:
+        """Return the connection to the pool"""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._raw, self._created_at)
+
+    def discard(self) -> None:
+        """Close the underlying connection instead of returning it to the pool"""
+        if not self._released:
+            self._released = True
+            self._pool.discard(self._raw)
+
+    def __del__(self) -> None:
+        # Safety net for code paths that never call close(): the connection state
+        # is unknown, so drop it rather than hand it to another request.
+        try:
+            self.discard()
+        except Exception:
+            pass
+
+
+class JoinedConnection:
+    """Handle given to repositories running inside a UnitOfWork.
+
+    Statements run on the unit of work's connection; commit() and close() are
+    no-ops because the unit of work commits (or rolls back) once at the end.
+    """
+
+    joined = True
+
+    def __init__(self, connection: PooledConnection, tag: str):
+        self._connection = connection
+        self.tag = tag
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def cursor(self, cursor: Any = None) -> InstrumentedCursor:
+        return InstrumentedCursor(self._connection._raw.cursor(cursor), self.tag)
+
+    def commit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def discard(self) -> None:
+        pass
+
+
+_local = threading.local()
+
+
+class UnitOfWork:
+    """Run several repository calls on one connection with a single commit.
+
+    While active on a thread, every DatabaseConnection.get_connection() on that
+    thread joins it, so multi-step operations avoid extra checkouts, extra
+    round trips for intermediate commits and partially applied writes. Nested
+    units of work join the outermost one.
+    """
+
+    def __init__(self, database: 'DatabaseConnection', tag: str):
+        self._database = database
+        self._tag = tag
+        self._connection: Optional[PooledConnection] = None
+
+    def __enter__(self) -> 'UnitOfWork':
+        if getattr(_local, 'unit_of_work', None) is None:
+            self._connection = self._database.get_connection(self._tag)
+            try:
+                self._connection.begin()
+            except Exception:
+                self._connection.discard()
+                raise
+            _local.unit_of_work = self._connection
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        connection = self._connection
+        if connection is None:
+            return
+        self._connection = None
+        _local.unit_of_work = None
+        try:
+            if exc_type is None:
+                connection._raw.commit()
+            else:
+                connection._raw.rollback()
+        except Exception:
+            connection.discard()
+            raise
+        connection.close()
+
+
+class ConnectionPool:
+    """Thread-safe, bounded pool of pymysql connections"""
+
+    def __init__(self, connect: Callable[[], pymysql.connections.Connection],
+                 min_size: int = 1, max_size: int = 10, timeout: float = 5,
+                 max_idle: float = 300, max_lifetime: float = 3600, ping_interval: float = 5):
+        if max_size < 1:
+            raise ValueError("Pool max_size must be at least 1")
+        self._connect = connect
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.ping_interval = ping_interval
+        # Idle entries are (connection, created_at, last_used); the right end is the
+        # most recently used so hot connections are reused and cold ones age out.
+        self._idle: Deque[Tuple[pymysql.connections.Connection, float, float]] = deque()
+        self._size = 0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> PooledConnection:
+        """Check out a live connection, waiting up to the configured timeout"""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            entry = None
+            with self._condition:
+                expired = self._pop_expired_idle()
+                if self._idle:
+                    entry = self._idle.pop()
+                elif self._size < self.max_size:
+                    self._size += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"Timed out after {self.timeout}s waiting for a database connection "
+                            f"(pool size {self.max_size})"
+                        )
+                    self._condition.wait(remaining)
+                    continue
+            self._close_quietly(expired)
+
+            if entry is None:
+                return self._open_new()
+
+            raw, created_at, last_used = entry
+            if self._is_usable(raw, created_at, last_used):
+                return PooledConnection(self, raw, created_at)
+            self.discard(raw)
+
+    def release(self, raw: pymysql.connections.Connection, created_at: float) -> None:
+        """Put a connection back into the idle set, rolling back any open transaction"""
+        if not raw.open:
+            self.discard(raw)
+            return
+        if raw.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+            try:
+                raw.rollback()
+            except Exception:
+                self.discard(raw)
+                return
+        with self._condition:
+            self._idle.append((raw, created_at, time.monotonic()))
+            self._condition.notify()
+
+    def discard(self, raw: pymysql.connections.Connection) -> None:
+        """Close a connection and free its slot in the pool"""
+        self._close_quietly([raw])
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def close_all(self) -> None:
+        """Close every idle connection; checked-out connections are closed on release"""
+        with self._condition:
+            idle = [raw for raw, _, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        self._close_quietly(idle)
+
+    def stats(self) -> Dict[str, int]:
+        """Return current pool occupancy"""
+        with self._condition:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'max_size': self.max_size
+            }
+
+    def _open_new(self) -> PooledConnection:
+        try:
+            raw = self._connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        return PooledConnection(self, raw, time.monotonic())
+
+    def _is_usable(self, raw: pymysql.connections.Connection, created_at: float, last_used: float) -> bool:
+        now = time.monotonic()
+        if self.max_lifetime and now - created_at > self.max_lifetime:
+            return False
+        if now - last_used > self.ping_interval:
+            try:
+                raw.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    def _pop_expired_idle(self) -> list:
+        """Remove connections idle for longer than max_idle, keeping at least min_size. Caller holds the lock."""
+        expired = []
+        if not self.max_idle:
+            return expired
+        cutoff = time.monotonic() - self.max_idle
+        while self._idle and self._size > self.min_size and self._idle[0][2] < cutoff:
+            expired.append(self._idle.popleft()[0])
+            self._size -= 1
+        return expired
+
+    @staticmethod
+    def _close_quietly(connections: list) -> None:
+        for raw in connections:
+            try:
+                raw.close()
+            except Exception:
+                pass
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(config: Optional[Config] = None) -> ConnectionPool:
+    """Return the process-wide connection pool, creating it on first use.
+
+    The pool is rebuilt after a fork so that worker processes never share sockets
+    inherited from their parent.
+    """
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is not None and _pool_pid == pid:
+        return _pool
+    with _pool_lock:
+        if _pool is None or _pool_pid != pid:
+            config = config or Config()
+            _pool = ConnectionPool(
+                lambda: _connect(config),
+                min_size=config.DB_POOL_MIN_SIZE,
+                max_size=config.DB_POOL_MAX_SIZE,
+                timeout=config.DB_POOL_TIMEOUT,
+                max_idle=config.DB_POOL_MAX_IDLE,
+                max_lifetime=config.DB_POOL_MAX_LIFETIME,
+                ping_interval=config.DB_POOL_PING_INTERVAL
+            )
+            _pool_pid = pid
+        return _pool
+
+
+def _connect(config: Config) -> pymysql.connections.Connection:
+    """Open a new physical connection to MySQL"""
+    # Validate that all required config values are present
+    if not all([config.DB_HOST, config.DB_PORT,
+               config.DB_USER, config.DB_PASSWORD,
+               config.DB_NAME]):
+        raise Exception("Missing database configuration values")
+
+    return pymysql.connect(
+        host=str(config.DB_HOST),
+        port=int(str(config.DB_PORT)),
+        user=str(config.DB_USER),
+        password=str(config.DB_PASSWORD),
+        database=str(config.DB_NAME),
+        cursorclass=DictCursor,
+        charset='utf8mb4'
+    )
+
+
+def _caller_tag(frame: Any) -> str:
+    """Build a ``Class.method`` tag from the frame that requested a connection"""
+    owner = frame.f_locals.get('self')
+    method = frame.f_code.co_name
+    return f"{type(owner).__name__}.{method}" if owner is not None else method
+
 
 class DatabaseConnection:
     def __init__(self):
         self.config = Config()
-    
-    def get_connection(self):
-        """Create and return a database connection"""
+
+    def get_connection(self, tag: Optional[str] = None) -> PooledConnection:
+        """Check out a connection from the shared pool; close() returns it.
+
+        Statements run on the connection are recorded under ``tag``, which
+        defaults to the calling ``Class.method`` (e.g. MySQLFavoriteVideoRepository.get_by_user).
+        Inside a unit of work the thread's shared connection is returned instead.
+        """
+        tag = tag or _caller_tag(sys._getframe(1))
+        active = getattr(_local, 'unit_of_work', None)
+        if active is not None:
+            return JoinedConnection(active, tag)
+        started = time.perf_counter()
         try:
-            # Validate that all required config values are present
-            if not all([self.config.DB_HOST, self.config.DB_PORT, 
-                       self.config.DB_USER, self.config.DB_PASSWORD, 
-                       self.config.DB_NAME]):
-                raise Exception("Missing database configuration values")
-            
-            # Type assertions to satisfy the linter
-            host = str(self.config.DB_HOST)
-            port = int(str(self.config.DB_PORT))
-            user = str(self.config.DB_USER)
-            password = str(self.config.DB_PASSWORD)
-            database = str(self.config.DB_NAME)
-            
-            connection = pymysql.connect(
-                host=host,
-                port=port,
-                user=user,
-                password=password,
-                database=database,
-                cursorclass=DictCursor,
-                charset='utf8mb4'
-            )
-            return connection
+            connection = get_pool(self.config).acquire()
+        except PoolTimeoutError:
+            raise
         except Exception as e:
             raise Exception(f"Database connection failed: {str(e)}")
-    
+        finally:
+            database_metrics.record_pool_wait(tag, (time.perf_counter() - started) * 1000)
+        connection.tag = tag
+        return connection
+
+    def transaction(self, tag: Optional[str] = None) -> UnitOfWork:
+        """Start (or join) a unit of work: ``with self.db_connection.transaction(): ...``"""
+        return UnitOfWork(self, tag or _caller_tag(sys._getframe(1)))
+
+    def stream(self, sql: str, args: Any = None, tag: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield rows one at a time from an unbuffered server-side cursor.
+
+        The connection is checked out on the first iteration and held until the
+        result set is exhausted, so memory stays flat regardless of row count. A
+        stream abandoned half-way discards its connection instead of draining
+        the remaining rows from the server.
+        """
+        return self._stream_rows(sql, args, tag or _caller_tag(sys._getframe(1)))
+
+    def _stream_rows(self, sql: str, args: Any, tag: str) -> Iterator[Dict[str, Any]]:
+        connection = self.get_connection(tag)
+        cursor = connection.cursor(SSDictCursor)
+        rows = 0
+        completed = False
+        try:
+            cursor.execute(sql, args)
+            for row in cursor:
+                rows += 1
+                yield row
+            cursor.close()
+            completed = True
+        finally:
+            database_metrics.record_rows(tag, rows)
+            if completed:
+                connection.close()
+            elif getattr(connection, 'joined', False):
+                # The unit of work keeps using this connection, so drain the rest of the result set
+                cursor.close()
+            else:
+                connection.discard()
+
     def test_connection(self):
         """Test the database connection"""
         try:
@@ -43,6 +436,7 @@ class DatabaseConnection:
                 cursor.execute("SELECT 1 as test")
                 result = cursor.fetchone()
             connection.close()
-            return {"status": "success", "message": "Database connection successful", "data": result}
+            return {"status": "success", "message": "Database connection successful", "data": result,
+                    "pool": get_pool(self.config).stats()}
         except Exception as e:
-            return {"status": "error", "message": f"Database connection failed: {str(e)}"} 
\ No newline at end of file
+            return {"status": "error", "message": f"Database connection failed: {str(e)}"}
@@ -17,6 +17,7 @@ CREATE TABLE users (
     reset_token VARCHAR(255) NULL,
     reset_token_expires TIMESTAMP NULL,
     INDEX idx_email (email),
+    INDEX idx_name_id (name, id),
     INDEX idx_active (active),
     INDEX idx_is_active (is_active)
 );
@@ -97,6 +98,7 @@ CREATE TABLE favorite_videos (
     INDEX idx_user_id (user_id),
     INDEX idx_video_id (video_id),
     INDEX idx_added_at (added_at),
+    INDEX idx_user_added_at (user_id, added_at),
     INDEX idx_channel (channel)
 );
 
@@ -109,11 +111,14 @@ CREATE TABLE trend_analysis (
     analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     results JSON NOT NULL, -- Store analysis results as JSON
     criteria JSON, -- Store analysis criteria as JSON
+    statistics JSON, -- Copy of results.statistics so listings never read the results blob
+    total_videos INT,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     INDEX idx_user_id (user_id),
     INDEX idx_category (category),
     INDEX idx_region (region),
-    INDEX idx_analyzed_at (analyzed_at)
+    INDEX idx_analyzed_at (analyzed_at),
+    INDEX idx_user_analyzed_at (user_id, analyzed_at)
 );
 
 -- View history table
@@ -129,6 +134,8 @@ CREATE TABLE view_history (
     INDEX idx_user_id (user_id),
     INDEX idx_video_id (video_id),
     INDEX idx_viewed_at (viewed_at),
+    INDEX idx_user_viewed_at (user_id, viewed_at),
+    INDEX idx_user_video (user_id, video_id),
     INDEX idx_completed (completed)
 );
 
@@ -155,14 +162,20 @@ CREATE TABLE trending_videos_cache (
     description TEXT,
     thumbnail_url VARCHAR(500),
     channel_title VARCHAR(255) NOT NULL,
-    published_at TIMESTAMP,
+    channel_id VARCHAR(50),
+    published_at TIMESTAMP NULL,
+    duration VARCHAR(20),
     view_count BIGINT,
     like_count INT,
     comment_count INT,
-    category_id INT,
+    tags JSON,
+    category_id INT NOT NULL DEFAULT 0,
     region_code VARCHAR(10) NOT NULL,
+    rank_position INT NOT NULL DEFAULT 0,
+    fetched_at DATETIME(6) NOT NULL,
     cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE KEY unique_video_region (video_id, region_code),
+    UNIQUE KEY unique_video_region_category (video_id, region_code, category_id),
+    INDEX idx_region_category_rank (region_code, category_id, rank_position),
     INDEX idx_region_code (region_code),
     INDEX idx_category_id (category_id),
     INDEX idx_cached_at (cached_at),
@@ -178,6 +191,27 @@ CREATE TABLE video_categories (
     INDEX idx_name (name)
 );
 
+-- YouTube API quota spent per quota day (Pacific Time), endpoint and user
+CREATE TABLE youtube_quota_usage (
+    quota_date DATE NOT NULL,
+    endpoint VARCHAR(32) NOT NULL,
+    user_id INT NOT NULL DEFAULT 0,
+    units BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (quota_date, endpoint, user_id)
+);
+
+-- Time-decayed interest weight per user and term (stored scaled to a fixed epoch)
+CREATE TABLE user_interest_terms (
+    user_id INT NOT NULL,
+    term VARCHAR(64) NOT NULL,
+    weight DOUBLE NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, term),
+    INDEX idx_user_weight (user_id, weight),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
 -- Insert sample user for testing (with authentication)
 INSERT INTO users (name, email, password_hash, salt, is_active, email_verified) 
 VALUES ('Test User', 'test@example.com', 'NEEDS_RESET', 'NEEDS_RESET', TRUE, FALSE);
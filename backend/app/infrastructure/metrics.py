@@ -0,0 +1,132 @@
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Optional
+from ..config import Config
+
+slow_query_logger = logging.getLogger('app.database.slow_queries')
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Latency histogram with fixed millisecond buckets (per-bucket, non-cumulative counts).
+
+    Not thread-safe on its own; owners guard it with their lock.
+    """
+
+    def __init__(self, buckets_ms=DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.count += 1
+        self.sum_ms += value_ms
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+        for index, bound in enumerate(self.buckets_ms):
+            if value_ms <= bound:
+                self.counts[index] += 1
+                return
+        self.counts[-1] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound}ms": count for bound, count in zip(self.buckets_ms, self.counts)}
+        buckets['le_inf'] = self.counts[-1]
+        return {
+            'count': self.count,
+            'sum_ms': round(self.sum_ms, 3),
+            'avg_ms': round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'buckets': buckets
+        }
+
+
+class _QueryStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.latency = LatencyHistogram()
+        self.pool_wait = LatencyHistogram()
+
+
+class DatabaseMetrics:
+    """Per-call-site SQL timing, row counts, pool wait time and slow-query log.
+
+    Call sites are tagged as ``RepositoryClass.method`` so hot statements can be
+    found without enabling MySQL's general log.
+    """
+
+    def __init__(self, slow_query_ms: Optional[float] = None, slow_query_log_size: int = 100):
+        self.slow_query_ms = slow_query_ms if slow_query_ms is not None else Config.DB_SLOW_QUERY_MS
+        self._stats: Dict[str, _QueryStats] = {}
+        self._slow_queries: Deque[Dict[str, Any]] = deque(maxlen=slow_query_log_size)
+        self._lock = threading.Lock()
+
+    def record_query(self, tag: str, sql: str, elapsed_ms: float, rows: int, error: bool = False) -> None:
+        with self._lock:
+            stats = self._stats_for(tag)
+            stats.calls += 1
+            stats.rows += max(rows, 0)
+            if error:
+                stats.errors += 1
+            stats.latency.observe(elapsed_ms)
+            is_slow = self.slow_query_ms and elapsed_ms >= self.slow_query_ms
+            if is_slow:
+                self._slow_queries.append({
+                    'tag': tag,
+                    'sql': ' '.join(sql.split()),
+                    'elapsed_ms': round(elapsed_ms, 3),
+                    'rows': rows,
+                    'at': datetime.now().isoformat()
+                })
+        if is_slow:
+            slow_query_logger.warning("Slow query in %s took %.1f ms (%d rows): %s",
+                                      tag, elapsed_ms, rows, ' '.join(sql.split()))
+
+    def record_rows(self, tag: str, rows: int) -> None:
+        """Add rows that were read after the statement was timed (unbuffered cursors)"""
+        with self._lock:
+            self._stats_for(tag).rows += rows
+
+    def record_pool_wait(self, tag: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self._stats_for(tag).pool_wait.observe(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'slow_query_threshold_ms': self.slow_query_ms,
+                'queries': {
+                    tag: {
+                        'calls': stats.calls,
+                        'errors': stats.errors,
+                        'rows': stats.rows,
+                        'latency': stats.latency.snapshot(),
+                        'pool_wait': stats.pool_wait.snapshot()
+                    }
+                    for tag, stats in sorted(self._stats.items())
+                },
+                'slow_queries': list(self._slow_queries)
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._slow_queries.clear()
+
+    def _stats_for(self, tag: str) -> _QueryStats:
+        stats = self._stats.get(tag)
+        if stats is None:
+            stats = self._stats[tag] = _QueryStats()
+        return stats
+
+
+# Process-wide collector shared by every DatabaseConnection
+database_metrics = DatabaseMetrics()
@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor token cannot be decoded"""
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Encode the (sort value, id) keyset position of the last row into an opaque token"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[Any, int]:
+    """Decode a token produced by encode_cursor back into (sort value, id)"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return sort_value, int(row_id)
+    except Exception:
+        raise InvalidCursorError("Invalid pagination cursor")
+
+
+def decode_datetime_cursor(token: str) -> Tuple[datetime, int]:
+    """Decode a cursor whose sort value is a timestamp"""
+    sort_value, row_id = decode_cursor(token)
+    try:
+        return datetime.fromisoformat(sort_value), row_id
+    except (TypeError, ValueError):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    """Bound a client-supplied page size to [1, MAX_PAGE_SIZE]"""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def split_page(rows: Sequence[dict], limit: int, sort_key: str) -> Tuple[List[dict], Optional[str]]:
+    """Trim the look-ahead row fetched with LIMIT n + 1 and build the next cursor"""
+    if len(rows) <= limit:
+        return list(rows), None
+    page_rows = list(rows[:limit])
+    last = page_rows[-1]
+    return page_rows, encode_cursor(last[sort_key], last['id'])
@@ -0,0 +1,37 @@
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from ..domain.models import StoredRecommendations
+from ..domain.ports import RecommendationCache
+from .youtube_cache import CacheEntry, LRUResponseCache
+
+
+class RecommendationStore(RecommendationCache):
+    """Per-user precomputed recommendations with a TTL and LRU eviction bounded by users and bytes"""
+
+    def __init__(self, ttl: float, max_users: int, max_bytes: int):
+        self.ttl = ttl
+        self._cache = LRUResponseCache(max_entries=max_users, max_bytes=max_bytes)
+
+    def get(self, user_id: int) -> Optional[StoredRecommendations]:
+        entry = self._cache.get(self._key(user_id))
+        return entry.value if entry is not None else None
+
+    def put(self, user_id: int, videos: List[Dict[str, Any]], max_results: int) -> StoredRecommendations:
+        stored = StoredRecommendations(videos=videos, max_results=max_results, generated_at=datetime.now())
+        self._cache.set(self._key(user_id), CacheEntry(
+            value=stored,
+            expires_at=time.time() + self.ttl,
+            size=len(json.dumps(videos, default=str))
+        ))
+        return stored
+
+    def invalidate(self, user_id: int) -> None:
+        self._cache.delete(self._key(user_id))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+    def _key(self, user_id: int) -> str:
+        return f"recommendations:{user_id}"
@@ -3,8 +3,11 @@ from typing import Optional, List
 from ...domain.models import User, UserSession, RefreshToken, UserRole, AuthAuditLog
 from ..database import DatabaseConnection
 import hashlib
+import logging
 import secrets
 
+logger = logging.getLogger(__name__)
+
 class MySQLAuthRepository:
     def __init__(self):
         self.db = DatabaseConnection()
@@ -12,27 +15,28 @@ class MySQLAuthRepository:
     def create_user(self, user: User) -> User:
         """Create a new user with authentication data"""
         try:
-            connection = self.db.get_connection()
-            with connection.cursor() as cursor:
-                sql = """
-                INSERT INTO users (name, email, password_hash, created_at, is_active, email_verified)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                """
-                cursor.execute(sql, (
-                    user.name,
-                    user.email,
-                    user.password_hash,
-                    user.created_at,
-                    user.is_active,
-                    user.email_verified
-                ))
-                user.id = cursor.lastrowid
-                connection.commit()
-                
-                # Create default role for user
-                self._create_default_role(user.id)
-                
-            connection.close()
+            # The user row and its default role share one connection and one commit
+            with self.db.transaction():
+                connection = self.db.get_connection()
+                with connection.cursor() as cursor:
+                    sql = """
+                    INSERT INTO users (name, email, password_hash, created_at, is_active, email_verified)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    """
+                    cursor.execute(sql, (
+                        user.name,
+                        user.email,
+                        user.password_hash,
+                        user.created_at,
+                        user.is_active,
+                        user.email_verified
+                    ))
+                    user.id = cursor.lastrowid
+                    
+                    # Create default role for user
+                    self._create_default_role(user.id)
+                    
+                connection.close()
             return user
         except Exception as e:
             raise Exception(f"Error creating user: {str(e)}")
@@ -323,7 +327,7 @@ class MySQLAuthRepository:
             raise Exception(f"Error logging auth event: {str(e)}")
     
     def _create_default_role(self, user_id: int) -> None:
-        """Create default 'user' role for new user"""
+        """Create default 'user' role for new user; runs inside create_user's unit of work"""
         try:
             connection = self.db.get_connection()
             with connection.cursor() as cursor:
@@ -332,8 +336,9 @@ class MySQLAuthRepository:
                 connection.commit()
             connection.close()
         except Exception as e:
-            # Log error but don't fail user creation
-            print(f"Warning: Could not create default role for user {user_id}: {str(e)}")
+            # A user without its role must not be committed: let the unit of work roll back
+            logger.error("Could not create default role for user %s: %s", user_id, e)
+            raise
     
     def cleanup_expired_sessions(self) -> int:
         """Clean up expired sessions and return count of cleaned sessions"""
@@ -1,9 +1,13 @@
 import json
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from ...domain.models import FavoriteVideo
+from ...domain.models import FavoriteVideo, Page
 from ...domain.repositories import FavoriteVideoRepository
 from ...infrastructure.database import DatabaseConnection
+from ...infrastructure.pagination import DEFAULT_PAGE_SIZE, clamp_page_size, decode_datetime_cursor, split_page
+
+# Lookups + inserts retried when a concurrent request adds the same favorites in between
+CREATE_MANY_ATTEMPTS = 3
 
 class MySQLFavoriteVideoRepository(FavoriteVideoRepository):
     def __init__(self):
@@ -44,6 +48,48 @@ class MySQLFavoriteVideoRepository(FavoriteVideoRepository):
             if connection:
                 connection.close()
     
+    def create_many(self, videos: List[FavoriteVideo]) -> List[bool]:
+        """Insert many favorites in one transaction with a multi-row INSERT.
+
+        Returns a flag per input video: True if it was created, False if it
+        already existed (unique_user_video) or repeats an earlier item. Every
+        video gets the id of its row either way.
+        """
+        if not videos:
+            return []
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                for _ in range(CREATE_MANY_ATTEMPTS):
+                    existing = self._select_ids(cursor, videos)
+                    created = []
+                    to_insert = []
+                    seen = set(existing)
+                    for video in videos:
+                        key = (video.user_id, video.video_id)
+                        is_new = key not in seen
+                        created.append(is_new)
+                        if is_new:
+                            seen.add(key)
+                            to_insert.append(video)
+                    
+                    if self._insert_all(cursor, to_insert):
+                        existing.update(self._select_ids(cursor, to_insert))
+                        connection.commit()
+                        for video in videos:
+                            video.id = existing.get((video.user_id, video.video_id), 0)
+                        return created
+                    # A concurrent request stored some of these videos after they were
+                    # looked up; start over so every item is classified from committed rows
+                    connection.rollback()
+                raise Exception("favorites kept being modified concurrently, retry later")
+                
+        except Exception as e:
+            raise Exception(f"Error creating favorite videos: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
     def get_by_id(self, video_id: int) -> Optional[FavoriteVideo]:
         """Get favorite video by ID"""
         try:
@@ -80,6 +126,35 @@ class MySQLFavoriteVideoRepository(FavoriteVideoRepository):
             if connection:
                 connection.close()
     
+    def get_page_by_user(self, user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                         cursor: Optional[str] = None) -> Page[FavoriteVideo]:
+        """Get one page of favorite videos for a user, newest first, keyed on (added_at, id)"""
+        limit = clamp_page_size(limit)
+        position = decode_datetime_cursor(cursor) if cursor else None
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as db_cursor:
+                if position:
+                    sql = """
+                    SELECT * FROM favorite_videos
+                    WHERE user_id = %s AND (added_at < %s OR (added_at = %s AND id < %s))
+                    ORDER BY added_at DESC, id DESC
+                    LIMIT %s
+                    """
+                    db_cursor.execute(sql, (user_id, position[0], position[0], position[1], limit + 1))
+                else:
+                    sql = "SELECT * FROM favorite_videos WHERE user_id = %s ORDER BY added_at DESC, id DESC LIMIT %s"
+                    db_cursor.execute(sql, (user_id, limit + 1))
+                rows, next_cursor = split_page(db_cursor.fetchall(), limit, 'added_at')
+                
+                return Page(items=[self._map_to_favorite_video(row) for row in rows], next_cursor=next_cursor)
+                
+        except Exception as e:
+            raise Exception(f"Error getting favorite videos page by user: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
     def get_by_youtube_id(self, user_id: int, youtube_video_id: str) -> Optional[FavoriteVideo]:
         """Get favorite video by YouTube ID and user"""
         try:
@@ -131,6 +206,42 @@ class MySQLFavoriteVideoRepository(FavoriteVideoRepository):
             if connection:
                 connection.close()
     
+    def update_many(self, videos: List[FavoriteVideo]) -> int:
+        """Update many favorite videos in one transaction"""
+        if not videos:
+            return 0
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = """
+                UPDATE favorite_videos 
+                SET title = %s, description = %s, url = %s, thumbnail = %s, 
+                    channel = %s, duration = %s, published_at = %s, notes = %s, tags = %s
+                WHERE id = %s
+                """
+                cursor.executemany(sql, [
+                    (
+                        video.title,
+                        video.description,
+                        video.url,
+                        video.thumbnail,
+                        video.channel,
+                        video.duration,
+                        video.published_at,
+                        video.notes,
+                        json.dumps(video.tags) if video.tags else None,
+                        video.id
+                    ) for video in videos
+                ])
+                connection.commit()
+                return len(videos)
+                
+        except Exception as e:
+            raise Exception(f"Error updating favorite videos: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
     def delete(self, video_id: int) -> bool:
         """Delete favorite video"""
         try:
@@ -147,6 +258,84 @@ class MySQLFavoriteVideoRepository(FavoriteVideoRepository):
             if connection:
                 connection.close()
     
+    def delete_by_user_and_video(self, user_id: int, youtube_video_id: str) -> bool:
+        """Delete a user's favorite by YouTube ID in one statement using unique_user_video"""
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = "DELETE FROM favorite_videos WHERE user_id = %s AND video_id = %s"
+                cursor.execute(sql, (user_id, youtube_video_id))
+                connection.commit()
+                return cursor.rowcount > 0
+                
+        except Exception as e:
+            raise Exception(f"Error deleting favorite video by YouTube ID: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def delete_many_by_user_and_videos(self, user_id: int, youtube_video_ids: List[str]) -> int:
+        """Delete many of a user's favorites by YouTube ID in one statement; returns rows deleted"""
+        if not youtube_video_ids:
+            return 0
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                placeholders = ', '.join(['%s'] * len(youtube_video_ids))
+                sql = f"DELETE FROM favorite_videos WHERE user_id = %s AND video_id IN ({placeholders})"
+                cursor.execute(sql, (user_id, *youtube_video_ids))
+                connection.commit()
+                return cursor.rowcount
+                
+        except Exception as e:
+            raise Exception(f"Error deleting favorite videos by YouTube ID: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def _insert_all(self, cursor, videos: List[FavoriteVideo]) -> bool:
+        """Insert the videos, returning False if any of them already existed"""
+        if not videos:
+            return True
+        # The no-op update keeps a concurrent insert of the same video from failing
+        # the statement; such rows count 0 affected rows instead of 1
+        sql = """
+        INSERT INTO favorite_videos 
+        (user_id, video_id, title, description, url, thumbnail, channel, duration, published_at, notes, tags)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE id = id
+        """
+        cursor.executemany(sql, [
+            (
+                video.user_id,
+                video.video_id,
+                video.title,
+                video.description,
+                video.url,
+                video.thumbnail,
+                video.channel,
+                video.duration,
+                video.published_at,
+                video.notes,
+                json.dumps(video.tags) if video.tags else None
+            ) for video in videos
+        ])
+        return cursor.rowcount == len(videos)
+    
+    def _select_ids(self, cursor, videos: List[FavoriteVideo]) -> Dict[Tuple[int, str], int]:
+        """Look up row ids of the given (user_id, video_id) pairs through unique_user_video"""
+        video_ids_by_user: Dict[int, List[str]] = {}
+        for video in videos:
+            video_ids_by_user.setdefault(video.user_id, []).append(video.video_id)
+        ids = {}
+        for user_id, video_ids in video_ids_by_user.items():
+            placeholders = ', '.join(['%s'] * len(video_ids))
+            sql = f"SELECT id, video_id FROM favorite_videos WHERE user_id = %s AND video_id IN ({placeholders})"
+            cursor.execute(sql, (user_id, *video_ids))
+            for row in cursor.fetchall():
+                ids[(user_id, row['video_id'])] = row['id']
+        return ids
+    
     def _map_to_favorite_video(self, row: dict) -> FavoriteVideo:
         """Map database row to FavoriteVideo object"""
         return FavoriteVideo(
@@ -1,9 +1,13 @@
 import json
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
-from ...domain.models import TrendAnalysis
+from ...domain.models import TrendAnalysis, TrendAnalysisSummary, Page
 from ...domain.repositories import TrendAnalysisRepository
 from ...infrastructure.database import DatabaseConnection
+from ...infrastructure.pagination import DEFAULT_PAGE_SIZE, clamp_page_size, decode_datetime_cursor, split_page
+
+# Listing projection: everything except the results blob
+SUMMARY_COLUMNS = "id, user_id, category, region, analyzed_at, criteria, statistics, total_videos"
 
 class MySQLTrendAnalysisRepository(TrendAnalysisRepository):
     def __init__(self):
@@ -16,8 +20,8 @@ class MySQLTrendAnalysisRepository(TrendAnalysisRepository):
             with connection.cursor() as cursor:
                 sql = """
                 INSERT INTO trend_analysis 
-                (user_id, category, region, analyzed_at, results, criteria)
-                VALUES (%s, %s, %s, %s, %s, %s)
+                (user_id, category, region, analyzed_at, results, criteria, statistics, total_videos)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 """
                 cursor.execute(sql, (
                     analysis.user_id,
@@ -25,7 +29,8 @@ class MySQLTrendAnalysisRepository(TrendAnalysisRepository):
                     analysis.region,
                     analysis.analyzed_at,
                     json.dumps(analysis.results),
-                    json.dumps(analysis.criteria) if analysis.criteria else None
+                    json.dumps(analysis.criteria) if analysis.criteria else None,
+                    *self._summary_values(analysis)
                 ))
                 connection.commit()
                 
@@ -75,6 +80,47 @@ class MySQLTrendAnalysisRepository(TrendAnalysisRepository):
             if connection:
                 connection.close()
     
+    def iter_summaries_by_user(self, user_id: int) -> Iterator[TrendAnalysisSummary]:
+        """Stream a user's analyses without their results, newest first"""
+        try:
+            sql = f"SELECT {SUMMARY_COLUMNS} FROM trend_analysis WHERE user_id = %s ORDER BY analyzed_at DESC, id DESC"
+            for row in self.db_connection.stream(sql, (user_id,)):
+                yield self._map_to_summary(row)
+        except Exception as e:
+            raise Exception(f"Error streaming trend analysis summaries by user: {str(e)}")
+    
+    def get_summary_page_by_user(self, user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                                 cursor: Optional[str] = None) -> Page[TrendAnalysisSummary]:
+        """Get one page of a user's analyses without their results, keyed on (analyzed_at, id)"""
+        limit = clamp_page_size(limit)
+        position = decode_datetime_cursor(cursor) if cursor else None
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as db_cursor:
+                if position:
+                    sql = f"""
+                    SELECT {SUMMARY_COLUMNS} FROM trend_analysis
+                    WHERE user_id = %s AND (analyzed_at < %s OR (analyzed_at = %s AND id < %s))
+                    ORDER BY analyzed_at DESC, id DESC
+                    LIMIT %s
+                    """
+                    db_cursor.execute(sql, (user_id, position[0], position[0], position[1], limit + 1))
+                else:
+                    sql = f"""
+                    SELECT {SUMMARY_COLUMNS} FROM trend_analysis
+                    WHERE user_id = %s ORDER BY analyzed_at DESC, id DESC LIMIT %s
+                    """
+                    db_cursor.execute(sql, (user_id, limit + 1))
+                rows, next_cursor = split_page(db_cursor.fetchall(), limit, 'analyzed_at')
+                
+                return Page(items=[self._map_to_summary(row) for row in rows], next_cursor=next_cursor)
+                
+        except Exception as e:
+            raise Exception(f"Error getting trend analysis summaries page by user: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
     def update(self, analysis: TrendAnalysis) -> TrendAnalysis:
         """Update trend analysis"""
         try:
@@ -82,7 +128,7 @@ class MySQLTrendAnalysisRepository(TrendAnalysisRepository):
             with connection.cursor() as cursor:
                 sql = """
                 UPDATE trend_analysis 
-                SET category = %s, region = %s, results = %s, criteria = %s
+                SET category = %s, region = %s, results = %s, criteria = %s, statistics = %s, total_videos = %s
                 WHERE id = %s
                 """
                 cursor.execute(sql, (
@@ -90,6 +136,7 @@ class MySQLTrendAnalysisRepository(TrendAnalysisRepository):
                     analysis.region,
                     json.dumps(analysis.results),
                     json.dumps(analysis.criteria) if analysis.criteria else None,
+                    *self._summary_values(analysis),
                     analysis.id
                 ))
                 connection.commit()
@@ -127,4 +174,23 @@ class MySQLTrendAnalysisRepository(TrendAnalysisRepository):
             analyzed_at=row['analyzed_at'],
             results=json.loads(row['results']),
             criteria=json.loads(row['criteria']) if row['criteria'] else {}
-        ) 
\ No newline at end of file
+        )
+    
+    def _map_to_summary(self, row: dict) -> TrendAnalysisSummary:
+        """Map a SUMMARY_COLUMNS row to TrendAnalysisSummary object"""
+        return TrendAnalysisSummary(
+            id=row['id'],
+            user_id=row['user_id'],
+            category=row['category'],
+            region=row['region'],
+            analyzed_at=row['analyzed_at'],
+            statistics=json.loads(row['statistics']) if row['statistics'] else {},
+            total_videos=row['total_videos'] or 0,
+            criteria=json.loads(row['criteria']) if row['criteria'] else {}
+        )
+    
+    def _summary_values(self, analysis: TrendAnalysis) -> tuple:
+        """Denormalized statistics/total_videos column values for an analysis"""
+        statistics = analysis.results.get('statistics')
+        total_videos = analysis.results.get('total_videos', len(analysis.results.get('videos', [])))
+        return (json.dumps(statistics) if statistics else None, total_videos)
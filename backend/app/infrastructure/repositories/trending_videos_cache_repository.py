@@ -0,0 +1,139 @@
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from ...domain.repositories import TrendingVideosCacheRepository
+from ...infrastructure.database import DatabaseConnection
+
+YOUTUBE_TIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+class MySQLTrendingVideosCacheRepository(TrendingVideosCacheRepository):
+    """Trending videos shared by every worker through the trending_videos_cache table.
+    
+    Rows are keyed by (video_id, region_code, category_id); category_id 0 stands
+    for the unfiltered chart. rank_position keeps the order YouTube returned and
+    fetched_at, shared by every row written by one replace(), identifies the fetch.
+    """
+    
+    def __init__(self):
+        self.db_connection = DatabaseConnection()
+    
+    def get_fresh(self, region_code: str, category_id: int, limit: int, max_age: int) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """Return (videos, age in seconds) for the top `limit` ranks if they all come
+        from a single fetch made within max_age seconds"""
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = """
+                SELECT *, TIMESTAMPDIFF(SECOND, fetched_at, NOW()) AS age
+                FROM trending_videos_cache
+                WHERE region_code = %s AND category_id = %s
+                ORDER BY rank_position
+                LIMIT %s
+                """
+                cursor.execute(sql, (region_code, category_id, limit))
+                results = cursor.fetchall()
+                
+                # replace() leaves a single fetch behind, but check it here too so rows
+                # written by different fetches are never served as one chart
+                if len(results) < limit or len({row['fetched_at'] for row in results}) > 1:
+                    return None
+                age = results[0]['age']
+                if age > max_age:
+                    return None
+                return [self._map_to_video(row) for row in results], age
+                
+        except Exception as e:
+            raise Exception(f"Error getting cached trending videos: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def replace(self, region_code: str, category_id: int, videos: List[Dict[str, Any]]) -> int:
+        """Replace the chart of a region/category with one fetch, in a single transaction.
+        
+        The videos are upserted under one fetched_at and every row left from an
+        earlier fetch is deleted, so the table always holds a single fetch.
+        """
+        if not videos:
+            return 0
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT NOW(6) AS fetched_at")
+                fetched_at = cursor.fetchone()['fetched_at']
+                sql = """
+                INSERT INTO trending_videos_cache 
+                (video_id, title, description, thumbnail_url, channel_title, channel_id, published_at,
+                 duration, view_count, like_count, comment_count, tags, category_id, region_code,
+                 rank_position, fetched_at, cached_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())
+                ON DUPLICATE KEY UPDATE
+                title = VALUES(title), description = VALUES(description),
+                thumbnail_url = VALUES(thumbnail_url), channel_title = VALUES(channel_title),
+                channel_id = VALUES(channel_id), published_at = VALUES(published_at),
+                duration = VALUES(duration), view_count = VALUES(view_count),
+                like_count = VALUES(like_count), comment_count = VALUES(comment_count),
+                tags = VALUES(tags), rank_position = VALUES(rank_position),
+                fetched_at = VALUES(fetched_at), cached_at = NOW()
+                """
+                cursor.executemany(sql, [
+                    (
+                        video['video_id'],
+                        video.get('title', ''),
+                        video.get('description', ''),
+                        video.get('thumbnail', ''),
+                        video.get('channel_title', ''),
+                        video.get('channel_id', ''),
+                        self._parse_published_at(video.get('published_at')),
+                        video.get('duration', ''),
+                        video.get('view_count', 0),
+                        video.get('like_count', 0),
+                        video.get('comment_count', 0),
+                        json.dumps(video.get('tags') or []),
+                        category_id,
+                        region_code,
+                        position,
+                        fetched_at
+                    ) for position, video in enumerate(videos)
+                ])
+                
+                # Rows of earlier fetches, including deeper ranks than this fetch covers, would
+                # never be served again next to the new ones
+                cursor.execute(
+                    "DELETE FROM trending_videos_cache WHERE region_code = %s AND category_id = %s AND fetched_at <> %s",
+                    (region_code, category_id, fetched_at)
+                )
+                connection.commit()
+                return len(videos)
+                
+        except Exception as e:
+            raise Exception(f"Error caching trending videos: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def _parse_published_at(self, value: Optional[str]) -> Optional[datetime]:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+        except ValueError:
+            return None
+    
+    def _map_to_video(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a database row to the dict shape returned by YouTubeAPIService"""
+        return {
+            'video_id': row['video_id'],
+            'title': row['title'],
+            'description': row['description'] or '',
+            'channel_title': row['channel_title'],
+            'channel_id': row['channel_id'] or '',
+            'published_at': row['published_at'].strftime(YOUTUBE_TIME_FORMAT) if row['published_at'] else '',
+            'thumbnail': row['thumbnail_url'] or '',
+            'url': f"https://www.youtube.com/watch?v={row['video_id']}",
+            'duration': row['duration'] or '',
+            'view_count': row['view_count'] or 0,
+            'like_count': row['like_count'] or 0,
+            'comment_count': row['comment_count'] or 0,
+            'tags': json.loads(row['tags']) if row['tags'] else []
+        }
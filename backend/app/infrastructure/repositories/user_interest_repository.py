@@ -0,0 +1,83 @@
+from typing import Dict, List, Tuple
+from ...domain.repositories import UserInterestRepository
+from ...infrastructure.database import DatabaseConnection
+
+class MySQLUserInterestRepository(UserInterestRepository):
+    """Per-user term weights in user_interest_terms, one row per (user_id, term)"""
+    
+    def __init__(self):
+        self.db_connection = DatabaseConnection()
+    
+    def add_weights(self, increments: Dict[Tuple[int, str], float]) -> None:
+        """Add weight increments with a single multi-row upsert"""
+        if not increments:
+            return
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = """
+                INSERT INTO user_interest_terms (user_id, term, weight)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE weight = weight + VALUES(weight)
+                """
+                cursor.executemany(sql, [
+                    (user_id, term, weight) for (user_id, term), weight in increments.items()
+                ])
+                connection.commit()
+                
+        except Exception as e:
+            raise Exception(f"Error updating user interests: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def get_top_terms(self, user_id: int, limit: int) -> List[Tuple[str, float]]:
+        """Get the heaviest terms of a user (served by the (user_id, weight) index)"""
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = """
+                SELECT term, weight FROM user_interest_terms
+                WHERE user_id = %s
+                ORDER BY weight DESC
+                LIMIT %s
+                """
+                cursor.execute(sql, (user_id, limit))
+                return [(row['term'], row['weight']) for row in cursor.fetchall()]
+                
+        except Exception as e:
+            raise Exception(f"Error getting user interests: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def prune(self, user_id: int, keep: int) -> int:
+        """Delete every term of a user below their `keep` heaviest ones"""
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                if keep <= 0:
+                    cursor.execute("DELETE FROM user_interest_terms WHERE user_id = %s", (user_id,))
+                    connection.commit()
+                    return cursor.rowcount
+                # The derived table lets MySQL read the cutoff from the table being deleted from
+                sql = """
+                DELETE FROM user_interest_terms
+                WHERE user_id = %s AND weight < (
+                    SELECT cutoff FROM (
+                        SELECT weight AS cutoff FROM user_interest_terms
+                        WHERE user_id = %s
+                        ORDER BY weight DESC
+                        LIMIT 1 OFFSET %s
+                    ) AS ranked
+                )
+                """
+                cursor.execute(sql, (user_id, user_id, keep - 1))
+                connection.commit()
+                return cursor.rowcount
+                
+        except Exception as e:
+            raise Exception(f"Error pruning user interests: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
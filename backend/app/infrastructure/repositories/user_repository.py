@@ -1,9 +1,10 @@
 import json
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
-from ...domain.models import User
+from ...domain.models import User, Page
 from ...domain.repositories import UserRepository
 from ...infrastructure.database import DatabaseConnection
+from ...infrastructure.pagination import DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor, split_page
 
 class MySQLUserRepository(UserRepository):
     def __init__(self):
@@ -91,6 +92,43 @@ class MySQLUserRepository(UserRepository):
             if connection:
                 connection.close()
     
+    def iter_all(self) -> Iterator[User]:
+        """Stream all users, mapping rows lazily from a server-side cursor"""
+        try:
+            sql = "SELECT * FROM users ORDER BY name ASC"
+            for row in self.db_connection.stream(sql):
+                yield self._map_to_user(row)
+        except Exception as e:
+            raise Exception(f"Error streaming all users: {str(e)}")
+    
+    def get_page(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> Page[User]:
+        """Get one page of users ordered by name, keyed on (name, id)"""
+        limit = clamp_page_size(limit)
+        position = decode_cursor(cursor) if cursor else None
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as db_cursor:
+                if position:
+                    sql = """
+                    SELECT * FROM users
+                    WHERE name > %s OR (name = %s AND id > %s)
+                    ORDER BY name ASC, id ASC
+                    LIMIT %s
+                    """
+                    db_cursor.execute(sql, (position[0], position[0], position[1], limit + 1))
+                else:
+                    sql = "SELECT * FROM users ORDER BY name ASC, id ASC LIMIT %s"
+                    db_cursor.execute(sql, (limit + 1,))
+                rows, next_cursor = split_page(db_cursor.fetchall(), limit, 'name')
+                
+                return Page(items=[self._map_to_user(row) for row in rows], next_cursor=next_cursor)
+                
+        except Exception as e:
+            raise Exception(f"Error getting users page: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
     def search_by_name(self, name: str) -> List[User]:
         """Search users by name (partial match)"""
         try:
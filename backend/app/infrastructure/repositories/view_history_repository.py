@@ -1,9 +1,10 @@
 import json
-from typing import List, Optional
+from typing import Iterator, List, Optional, Set
 from datetime import datetime
-from ...domain.models import ViewHistory
+from ...domain.models import ViewHistory, Page
 from ...domain.repositories import ViewHistoryRepository
 from ...infrastructure.database import DatabaseConnection
+from ...infrastructure.pagination import DEFAULT_PAGE_SIZE, clamp_page_size, decode_datetime_cursor, split_page
 
 class MySQLViewHistoryRepository(ViewHistoryRepository):
     def __init__(self):
@@ -39,6 +40,33 @@ class MySQLViewHistoryRepository(ViewHistoryRepository):
             if connection:
                 connection.close()
     
+    def create_many(self, histories: List[ViewHistory]) -> int:
+        """Insert many view history entries with a multi-row INSERT and a single commit"""
+        if not histories:
+            return 0
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = """
+                INSERT INTO view_history 
+                (user_id, video_id, title, viewed_at, view_duration, completed)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                """
+                # pymysql rewrites executemany on INSERT ... VALUES into multi-row statements
+                cursor.executemany(sql, [
+                    (h.user_id, h.video_id, h.title, h.viewed_at, h.view_duration, h.completed)
+                    for h in histories
+                ])
+                connection.commit()
+                return cursor.rowcount
+                
+        except Exception as e:
+            # Chained so the batch writer can tell rejected rows from connection trouble
+            raise Exception(f"Error creating view history batch: {str(e)}") from e
+        finally:
+            if connection:
+                connection.close()
+    
     def get_by_user(self, user_id: int) -> List[ViewHistory]:
         """Get all view history for a user"""
         try:
@@ -56,6 +84,106 @@ class MySQLViewHistoryRepository(ViewHistoryRepository):
             if connection:
                 connection.close()
     
+    def iter_by_user(self, user_id: int) -> Iterator[ViewHistory]:
+        """Stream all view history for a user, mapping rows lazily from a server-side cursor"""
+        try:
+            sql = "SELECT * FROM view_history WHERE user_id = %s ORDER BY viewed_at DESC"
+            for row in self.db_connection.stream(sql, (user_id,)):
+                yield self._map_to_view_history(row)
+        except Exception as e:
+            raise Exception(f"Error streaming view history by user: {str(e)}")
+    
+    def get_page_by_user(self, user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                         cursor: Optional[str] = None) -> Page[ViewHistory]:
+        """Get one page of view history for a user, newest first, keyed on (viewed_at, id)"""
+        limit = clamp_page_size(limit)
+        position = decode_datetime_cursor(cursor) if cursor else None
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as db_cursor:
+                if position:
+                    sql = """
+                    SELECT * FROM view_history
+                    WHERE user_id = %s AND (viewed_at < %s OR (viewed_at = %s AND id < %s))
+                    ORDER BY viewed_at DESC, id DESC
+                    LIMIT %s
+                    """
+                    db_cursor.execute(sql, (user_id, position[0], position[0], position[1], limit + 1))
+                else:
+                    sql = "SELECT * FROM view_history WHERE user_id = %s ORDER BY viewed_at DESC, id DESC LIMIT %s"
+                    db_cursor.execute(sql, (user_id, limit + 1))
+                rows, next_cursor = split_page(db_cursor.fetchall(), limit, 'viewed_at')
+                
+                return Page(items=[self._map_to_view_history(row) for row in rows], next_cursor=next_cursor)
+                
+        except Exception as e:
+            raise Exception(f"Error getting view history page by user: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def get_by_user_in_range(self, user_id: int, since: Optional[datetime] = None,
+                             until: Optional[datetime] = None) -> List[ViewHistory]:
+        """Get a user's views with since <= viewed_at < until, newest first.
+
+        Either bound may be omitted. The filter runs in SQL on the
+        (user_id, viewed_at) index, so cost follows the window, not the history size.
+        """
+        try:
+            conditions = ["user_id = %s"]
+            params: list = [user_id]
+            if since is not None:
+                conditions.append("viewed_at >= %s")
+                params.append(since)
+            if until is not None:
+                conditions.append("viewed_at < %s")
+                params.append(until)
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = f"SELECT * FROM view_history WHERE {' AND '.join(conditions)} ORDER BY viewed_at DESC, id DESC"
+                cursor.execute(sql, tuple(params))
+                results = cursor.fetchall()
+                
+                return [self._map_to_view_history(row) for row in results]
+                
+        except Exception as e:
+            raise Exception(f"Error getting view history in range: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def get_recent_by_user(self, user_id: int, limit: int) -> List[ViewHistory]:
+        """Get a user's last N views, newest first"""
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = "SELECT * FROM view_history WHERE user_id = %s ORDER BY viewed_at DESC, id DESC LIMIT %s"
+                cursor.execute(sql, (user_id, max(0, int(limit))))
+                results = cursor.fetchall()
+                
+                return [self._map_to_view_history(row) for row in results]
+                
+        except Exception as e:
+            raise Exception(f"Error getting recent view history: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def get_video_ids_by_user(self, user_id: int) -> Set[str]:
+        """Get the distinct ids of every video a user has watched"""
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = "SELECT DISTINCT video_id FROM view_history WHERE user_id = %s"
+                cursor.execute(sql, (user_id,))
+                return {row['video_id'] for row in cursor.fetchall()}
+                
+        except Exception as e:
+            raise Exception(f"Error getting watched video ids: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
     def update(self, history: ViewHistory) -> ViewHistory:
         """Update view history"""
         try:
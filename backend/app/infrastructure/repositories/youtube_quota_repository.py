@@ -0,0 +1,47 @@
+from datetime import date
+from typing import Any, Dict, List, Tuple
+from ...domain.repositories import YouTubeQuotaRepository
+from ...infrastructure.database import DatabaseConnection
+
+class MySQLYouTubeQuotaRepository(YouTubeQuotaRepository):
+    def __init__(self):
+        self.db_connection = DatabaseConnection()
+    
+    def add_usage(self, usage: Dict[Tuple[date, str, int], int]) -> None:
+        """Add spent units to the running totals of each (quota day, endpoint, user)"""
+        if not usage:
+            return
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = """
+                INSERT INTO youtube_quota_usage (quota_date, endpoint, user_id, units)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE units = units + VALUES(units)
+                """
+                cursor.executemany(sql, [
+                    (quota_date, endpoint, user_id, units)
+                    for (quota_date, endpoint, user_id), units in usage.items()
+                ])
+                connection.commit()
+                
+        except Exception as e:
+            raise Exception(f"Error recording YouTube quota usage: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
+    
+    def get_usage(self, quota_date: date) -> List[Dict[str, Any]]:
+        """Get the spend of a quota day per endpoint and user"""
+        try:
+            connection = self.db_connection.get_connection()
+            with connection.cursor() as cursor:
+                sql = "SELECT endpoint, user_id, units FROM youtube_quota_usage WHERE quota_date = %s"
+                cursor.execute(sql, (quota_date,))
+                return list(cursor.fetchall())
+                
+        except Exception as e:
+            raise Exception(f"Error getting YouTube quota usage: {str(e)}")
+        finally:
+            if connection:
+                connection.close()
@@ -0,0 +1,68 @@
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Set
+from ..domain.ports import SeenVideosStore
+from .youtube_cache import CacheEntry, LRUResponseCache
+
+
+class SeenVideosCache(SeenVideosStore):
+    """Per-user set of watched video ids, loaded once and kept current on writes.
+
+    The set is read from the database the first time a user needs it (and again
+    after ``ttl``); every view recorded by this process is added in memory, so
+    filtering recommendations never costs a query while the set is cached.
+    Views added while a user's set is being loaded are merged into the result.
+    """
+
+    def __init__(self, loader: Callable[[int], Set[str]], ttl: float, max_users: int, max_bytes: int):
+        self.loader = loader
+        self.ttl = ttl
+        self._cache = LRUResponseCache(max_entries=max_users, max_bytes=max_bytes)
+        self._lock = threading.Lock()
+        self._loading: Dict[int, Set[str]] = {}
+
+    def get(self, user_id: int) -> FrozenSet[str]:
+        entry = self._cache.get(self._key(user_id))
+        if entry is not None:
+            return entry.value
+        with self._lock:
+            pending = self._loading.setdefault(user_id, set())
+        try:
+            loaded = self.loader(user_id)
+        except Exception:
+            with self._lock:
+                self._loading.pop(user_id, None)
+            raise
+        with self._lock:
+            video_ids = frozenset(loaded) | self._loading.pop(user_id, pending)
+            self._store(user_id, video_ids)
+        return video_ids
+
+    def add(self, user_id: int, video_ids: Iterable[str]) -> None:
+        """Mark videos as watched; users whose set is not cached pick them up on their next load"""
+        video_ids = set(video_ids)
+        if not video_ids:
+            return
+        with self._lock:
+            if user_id in self._loading:
+                self._loading[user_id] |= video_ids
+            entry = self._cache.get(self._key(user_id))
+            if entry is not None and not video_ids <= entry.value:
+                self._store(user_id, entry.value | video_ids, expires_at=entry.expires_at)
+
+    def invalidate(self, user_id: int) -> None:
+        self._cache.delete(self._key(user_id))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+    def _store(self, user_id: int, video_ids: FrozenSet[str], expires_at: float = 0) -> None:
+        self._cache.set(self._key(user_id), CacheEntry(
+            value=video_ids,
+            expires_at=expires_at or time.time() + self.ttl,
+            size=sys.getsizeof(video_ids) + sum(sys.getsizeof(video_id) for video_id in video_ids)
+        ))
+
+    def _key(self, user_id: int) -> str:
+        return f"seen:{user_id}"
@@ -0,0 +1,160 @@
+import logging
+import os
+import queue
+import threading
+import time
+import pymysql
+from typing import Callable, Dict, List, Optional
+from ..config import Config
+from ..domain.models import ViewHistory
+from ..domain.repositories import ViewHistoryRepository
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# Longest pause between retries of a batch while the database is unreachable
+MAX_RETRY_DELAY = 10.0
+
+
+def _is_row_error(error: BaseException) -> bool:
+    """Whether the database rejected the data itself, as opposed to the connection failing"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, (pymysql.err.IntegrityError, pymysql.err.DataError)):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class ViewBufferFullError(Exception):
+    """Raised when the view event buffer stays full for longer than the enqueue timeout"""
+
+
+class ViewEventWriter:
+    """Write-behind buffer for view events.
+
+    Requests enqueue events and return immediately; a background thread writes
+    them with multi-row INSERTs whenever a batch fills up or the flush interval
+    elapses. The queue is bounded, so a stalled database pushes back on callers
+    instead of growing memory without limit. A batch with rows the database
+    rejects (integrity or data errors) is split in halves and retried, so only
+    the offending rows are dropped; on connection errors the whole batch is
+    retried with exponential backoff, and only dropped once the retries run out.
+    """
+
+    def __init__(self, repository: ViewHistoryRepository, batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None, max_queue_size: Optional[int] = None,
+                 enqueue_timeout: Optional[float] = None, retry_attempts: Optional[int] = None,
+                 retry_backoff: Optional[float] = None,
+                 on_written: Optional[Callable[[List[ViewHistory]], None]] = None):
+        config = Config()
+        self.repository = repository
+        # Called with the events of every batch that were stored (e.g. to update interest profiles)
+        self.on_written = on_written
+        self.batch_size = batch_size or config.VIEW_WRITER_BATCH_SIZE
+        self.flush_interval = flush_interval or config.VIEW_WRITER_FLUSH_INTERVAL
+        self.enqueue_timeout = enqueue_timeout if enqueue_timeout is not None else config.VIEW_WRITER_ENQUEUE_TIMEOUT
+        self.retry_attempts = retry_attempts if retry_attempts is not None else config.VIEW_WRITER_RETRY_ATTEMPTS
+        self.retry_backoff = retry_backoff if retry_backoff is not None else config.VIEW_WRITER_RETRY_BACKOFF
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size or config.VIEW_WRITER_MAX_QUEUE)
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._counters = {'written': 0, 'batches': 0, 'failed': 0, 'rejected': 0, 'retries': 0}
+
+    def submit(self, history: ViewHistory) -> None:
+        """Queue a view event for writing, raising ViewBufferFullError under sustained backpressure"""
+        self._ensure_started()
+        try:
+            self._queue.put(history, timeout=self.enqueue_timeout)
+        except queue.Full:
+            with self._lock:
+                self._counters['rejected'] += 1
+            raise ViewBufferFullError("View event buffer is full, retry later")
+
+    def close(self, timeout: float = 10) -> None:
+        """Flush every queued event and stop the background thread"""
+        thread = self._thread
+        if thread is None or not thread.is_alive() or self._pid != os.getpid():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("View event writer could not be stopped: buffer still full")
+            return
+        thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters, queued=self._queue.qsize())
+
+    def _ensure_started(self) -> None:
+        # Started lazily (and restarted after fork) so every worker process owns its thread
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='view-event-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        batch: List[ViewHistory] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._flush(batch)
+                return
+            if item is not None:
+                batch.append(item)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch: List[ViewHistory]) -> None:
+        if not batch:
+            return
+        written = self._write(batch)
+        with self._lock:
+            self._counters['written'] += len(written)
+            self._counters['failed'] += len(batch) - len(written)
+            self._counters['batches'] += 1
+        if written and self.on_written is not None:
+            try:
+                self.on_written(written)
+            except Exception:
+                logger.exception("View batch listener failed")
+
+    def _write(self, batch: List[ViewHistory]) -> List[ViewHistory]:
+        """Insert a batch, retrying connection errors and bisecting rejected rows; returns what was stored"""
+        attempt = 0
+        while True:
+            try:
+                self.repository.create_many(batch)
+                return batch
+            except Exception as e:
+                if _is_row_error(e):
+                    error = e
+                    break
+                if attempt >= self.retry_attempts:
+                    logger.error("Dropping %d view events after %d retries: %s", len(batch), attempt, e)
+                    return []
+                delay = min(self.retry_backoff * 2 ** attempt, MAX_RETRY_DELAY)
+                logger.warning("Writing %d view events failed, retrying in %.1fs: %s", len(batch), delay, e)
+                with self._lock:
+                    self._counters['retries'] += 1
+                attempt += 1
+                time.sleep(delay)
+        if len(batch) == 1:
+            logger.error("Dropping view event of user %s for video %s: %s",
+                         batch[0].user_id, batch[0].video_id, error)
+            return []
+        middle = len(batch) // 2
+        return self._write(batch[:middle]) + self._write(batch[middle:])
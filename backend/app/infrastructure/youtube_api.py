@@ -1,18 +1,143 @@
+import contextvars
+import copy
+import json
+import logging
+import threading
+import time
 import requests
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from ..config import Config
+from ..domain.ports import VideoIndex
+from ..domain.repositories import TrendingVideosCacheRepository
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .single_flight import SingleFlight
+from .youtube_quota import QuotaExhaustedError, QuotaLedger
+from .youtube_cache import CacheEntry, LRUResponseCache, ResponseCache, cache_key
+
+logger = logging.getLogger(__name__)
+
+# The videos endpoint accepts at most this many comma-separated ids per call
+VIDEOS_BATCH_SIZE = 50
+
+# Largest maxResults YouTube accepts for search and chart listings; more needs page tokens
+PAGE_SIZE = 50
+
+# Circuit breakers are per endpoint type; every videos.list variant shares one
+BREAKER_GROUPS = {
+    'search': 'search',
+    'search-page': 'search',
+    'video': 'videos',
+    'video-batch': 'videos',
+    'trending': 'videos',
+    'trending-page': 'videos',
+    'categories': 'categories'
+}
+
+# Partial-response masks: exactly the fields the _format_* methods read. Keep them in
+# sync with the formatters; "rich" requests skip the mask and get the full parts.
+SEARCH_FIELDS = 'etag,items(id/videoId,snippet(title,description,channelTitle,publishedAt,thumbnails/medium/url))'
+VIDEO_FIELDS = (
+    'etag,items(id,'
+    'snippet(title,description,channelTitle,channelId,publishedAt,thumbnails/medium/url,tags),'
+    'statistics(viewCount,likeCount,commentCount),'
+    'contentDetails/duration)'
+)
+CATEGORY_FIELDS = 'etag,items(id,snippet(title,assignable))'
+
+FRESHNESS_FRESH = 'fresh'
+FRESHNESS_STALE = 'stale'
+
+# Freshness of the YouTube data served for the current request; stale wins over fresh
+data_freshness: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('data_freshness', default=None)
+
+class _BoundedRetry(Retry):
+    """Retry policy that honours Retry-After but never sleeps longer than max_retry_after"""
+    
+    def __init__(self, *args, max_retry_after: float = 5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+    
+    def new(self, **kwargs) -> 'Retry':
+        # urllib3 rebuilds the policy on every increment(); carry the cap over
+        kwargs.setdefault('max_retry_after', self.max_retry_after)
+        return super().new(**kwargs)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+def create_youtube_session(config: Config) -> requests.Session:
+    """Keep-alive session with bounded retries on 429/5xx for the YouTube Data API"""
+    retry = _BoundedRetry(
+        total=config.YOUTUBE_MAX_RETRIES,
+        backoff_factor=config.YOUTUBE_RETRY_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        max_retry_after=config.YOUTUBE_MAX_RETRY_AFTER
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.YOUTUBE_POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
 
 class YouTubeAPIService:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, cache: Optional[ResponseCache] = None,
+                 trending_store: Optional[TrendingVideosCacheRepository] = None,
+                 quota: Optional[QuotaLedger] = None, content_index: Optional[VideoIndex] = None):
         self.config = Config()
         self.base_url = "https://www.googleapis.com/youtube/v3"
         self.api_key = self.config.YOUTUBE_API_KEY
         
         if not self.api_key:
             raise Exception("YouTube API key not configured")
+        
+        self.session = session or create_youtube_session(self.config)
+        self.timeout = (self.config.YOUTUBE_CONNECT_TIMEOUT, self.config.YOUTUBE_READ_TIMEOUT)
+        self.cache = cache or LRUResponseCache(
+            max_entries=self.config.YOUTUBE_CACHE_MAX_ENTRIES,
+            max_bytes=self.config.YOUTUBE_CACHE_MAX_BYTES,
+            stale_ttl=self.config.YOUTUBE_CACHE_STALE_TTL
+        )
+        self.cache_ttls = {
+            'search': self.config.YOUTUBE_CACHE_TTL_SEARCH,
+            'search-page': self.config.YOUTUBE_CACHE_TTL_SEARCH,
+            'video': self.config.YOUTUBE_CACHE_TTL_VIDEO,
+            'trending': self.config.YOUTUBE_CACHE_TTL_TRENDING,
+            'trending-page': self.config.YOUTUBE_CACHE_TTL_TRENDING,
+            'categories': self.config.YOUTUBE_CACHE_TTL_CATEGORIES
+        }
+        self.trending_store = trending_store
+        self.quota = quota or QuotaLedger()
+        # Every video fetched from YouTube is fed to the local index, if one is attached
+        self.content_index = content_index
+        self.single_flight = SingleFlight()
+        self.breakers = {
+            group: CircuitBreaker(
+                group,
+                failure_threshold=self.config.YOUTUBE_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=self.config.YOUTUBE_BREAKER_RESET_TIMEOUT
+            )
+            for group in set(BREAKER_GROUPS.values())
+        }
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_executor_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self._conditional_counters = {'revalidations': 0, 'not_modified': 0}
     
     def search_videos(self, query: str, max_results: int = 10, region_code: str = "US") -> List[Dict[str, Any]]:
         """Search for videos using YouTube Data API"""
+        if max_results > PAGE_SIZE:
+            return list(islice(self.iter_search_videos(query, region_code), max_results))
         try:
             url = f"{self.base_url}/search"
             params = {
@@ -21,43 +146,82 @@ class YouTubeAPIService:
                 'type': 'video',
                 'maxResults': max_results,
                 'regionCode': region_code,
+                'fields': SEARCH_FIELDS,
                 'key': self.api_key
             }
             
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            return self._format_search_results(data.get('items', []))
+            return self._get('search', url, params, lambda data: self._format_search_results(data.get('items', [])))
             
         except requests.RequestException as e:
             raise Exception(f"YouTube API request failed: {str(e)}")
     
-    def get_video_details(self, video_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed information about a specific video"""
+    def iter_search_videos(self, query: str, region_code: str = "US") -> Iterator[Dict[str, Any]]:
+        """Lazily yield search results, following nextPageToken one page at a time.
+        
+        Each page costs a search call (100 units), so stop iterating (e.g. with
+        itertools.islice) as soon as you have enough results.
+        """
+        params = {
+            'part': 'snippet',
+            'q': query,
+            'type': 'video',
+            'maxResults': PAGE_SIZE,
+            'regionCode': region_code,
+            'fields': 'nextPageToken,' + SEARCH_FIELDS,
+            'key': self.api_key
+        }
+        return self._iter_pages('search-page', f"{self.base_url}/search", params, self._format_search_results)
+    
+    def get_video_details(self, video_id: str, rich: bool = False) -> Optional[Dict[str, Any]]:
+        """Get detailed information about a specific video (``rich`` adds every thumbnail, localization and format detail)"""
         try:
             url = f"{self.base_url}/videos"
-            params = {
-                'part': 'snippet,statistics,contentDetails',
-                'id': video_id,
-                'key': self.api_key
-            }
+            return self._get('video', url, self._video_params(video_id, rich),
+                             lambda data: self._format_first_video(data, rich))
             
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            items = data.get('items', [])
+        except requests.RequestException as e:
+            raise Exception(f"YouTube API request failed: {str(e)}")
+    
+    def get_videos_details_batch(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get details for many videos, keyed by video id.
+        
+        Ids already cached by get_video_details are served locally; the rest are
+        requested 50 per call (same quota cost as a single id) with the chunks
+        running concurrently. Ids YouTube does not return are left out.
+        """
+        try:
+            details: Dict[str, Dict[str, Any]] = {}
+            missing = []
+            for video_id in dict.fromkeys(video_ids):
+                entry = self.cache.get(cache_key('video', self._video_params(video_id)))
+                if entry is None:
+                    missing.append(video_id)
+                elif entry.value is not None:
+                    details[video_id] = self._copy(entry.value)
             
-            if items:
-                return self._format_video_details(items[0])
-            return None
+            chunks = [missing[i:i + VIDEOS_BATCH_SIZE] for i in range(0, len(missing), VIDEOS_BATCH_SIZE)]
+            if len(chunks) <= 1:
+                results = [self._fetch_videos_chunk_once(chunk) for chunk in chunks]
+            else:
+                # Chunks run in the caller's context so quota spend stays attributed to its user
+                executor = self._get_batch_executor()
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._fetch_videos_chunk_once, chunk)
+                    for chunk in chunks
+                ]
+                results = [future.result() for future in futures]
+            for fetched in results:
+                details.update({video_id: self._copy(video) for video_id, video in fetched.items()})
+            return details
             
         except requests.RequestException as e:
             raise Exception(f"YouTube API request failed: {str(e)}")
     
-    def get_trending_videos(self, region_code: str = "US", category_id: Optional[str] = None, max_results: int = 20) -> List[Dict[str, Any]]:
-        """Get trending videos for a specific region and category"""
+    def get_trending_videos(self, region_code: str = "US", category_id: Optional[str] = None, max_results: int = 20,
+                            rich: bool = False) -> List[Dict[str, Any]]:
+        """Get trending videos for a specific region and category (``rich`` as in get_video_details)"""
+        if max_results > PAGE_SIZE:
+            return list(islice(self.iter_trending_videos(region_code, category_id, rich), max_results))
         try:
             url = f"{self.base_url}/videos"
             params = {
@@ -70,16 +234,40 @@ class YouTubeAPIService:
             
             if category_id:
                 params['videoCategoryId'] = category_id
+            if not rich:
+                params['fields'] = VIDEO_FIELDS
             
-            response = requests.get(url, params=params)
-            response.raise_for_status()
+            read_through = write_through = None
+            # The shared table only holds the standard fields and is keyed by numeric category
+            if self.trending_store is not None and not rich and (not category_id or str(category_id).isdigit()):
+                chart_category = int(category_id) if category_id else 0
+                read_through = lambda: self._load_trending(region_code, chart_category, max_results)
+                write_through = lambda videos: self._store_trending(region_code, chart_category, videos)
             
-            data = response.json()
-            return [self._format_video_details(item) for item in data.get('items', [])]
+            return self._get('trending', url, params,
+                             lambda data: [self._format_video_details(item, rich) for item in data.get('items', [])],
+                             read_through=read_through, write_through=write_through)
             
         except requests.RequestException as e:
             raise Exception(f"YouTube API request failed: {str(e)}")
     
+    def iter_trending_videos(self, region_code: str = "US", category_id: Optional[str] = None,
+                             rich: bool = False) -> Iterator[Dict[str, Any]]:
+        """Lazily yield the trending chart, following nextPageToken one page at a time"""
+        params = {
+            'part': 'snippet,statistics,contentDetails',
+            'chart': 'mostPopular',
+            'regionCode': region_code,
+            'maxResults': PAGE_SIZE,
+            'key': self.api_key
+        }
+        if category_id:
+            params['videoCategoryId'] = category_id
+        if not rich:
+            params['fields'] = 'nextPageToken,' + VIDEO_FIELDS
+        return self._iter_pages('trending-page', f"{self.base_url}/videos", params,
+                                lambda items: [self._format_video_details(item, rich) for item in items])
+    
     def get_video_categories(self, region_code: str = "US") -> List[Dict[str, Any]]:
         """Get available video categories for a region"""
         try:
@@ -87,25 +275,276 @@ class YouTubeAPIService:
             params = {
                 'part': 'snippet',
                 'regionCode': region_code,
+                'fields': CATEGORY_FIELDS,
                 'key': self.api_key
             }
             
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            return [
-                {
-                    'id': item['id'],
-                    'title': item['snippet']['title'],
-                    'assignable': item['snippet'].get('assignable', False)
-                }
-                for item in data.get('items', [])
-            ]
+            return self._get('categories', url, params, self._format_categories)
             
         except requests.RequestException as e:
             raise Exception(f"YouTube API request failed: {str(e)}")
     
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters of the response cache"""
+        return self.cache.stats()
+    
+    def quota_stats(self) -> Dict[str, Any]:
+        """Quota spent today per endpoint and top users, and the current budget mode"""
+        return self.quota.stats()
+    
+    def single_flight_stats(self) -> Dict[str, int]:
+        """Upstream loads started (leaders) vs. callers that joined one already in flight (coalesced)"""
+        return self.single_flight.stats()
+    
+    def conditional_stats(self) -> Dict[str, int]:
+        """Conditional revalidations sent with If-None-Match and how many came back 304"""
+        with self._refresh_lock:
+            return dict(self._conditional_counters)
+    
+    def breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """State of the circuit breaker of each endpoint type"""
+        return {group: breaker.stats() for group, breaker in self.breakers.items()}
+    
+    def _get(self, kind: str, url: str, params: Dict[str, Any], transform: Callable[[Dict[str, Any]], Any],
+             read_through: Optional[Callable[[], Optional[CacheEntry]]] = None,
+             write_through: Optional[Callable[[Any], None]] = None) -> Any:
+        """GET a YouTube Data API resource through the response cache.
+        
+        The formatted value (not the raw body) is cached under the normalized
+        parameters with the TTL configured for ``kind``. Callers get a copy so
+        cached results cannot be mutated in place. ``read_through`` and
+        ``write_through`` plug in a shared second tier consulted on a local miss
+        and refreshed after an upstream fetch. Concurrent misses on the same key
+        share a single load.
+        
+        An expired entry still inside the stale window is served right away
+        (stale-while-revalidate) and refreshed in the background, unless the
+        endpoint's circuit breaker is open, in which case it is just served.
+        """
+        key = cache_key(kind, params)
+        entry = self.cache.get(key, allow_stale=True)
+        stale = entry if entry is not None and not entry.is_fresh() else None
+        load = lambda: self._load(kind, key, url, params, transform, read_through, write_through, stale)
+        if stale is not None:
+            if not self.breakers[BREAKER_GROUPS[kind]].is_open():
+                self._refresh_in_background(key, load)
+            self._mark_freshness(FRESHNESS_STALE)
+            return self._copy(entry.value)
+        if entry is None:
+            entry = self.single_flight.do(key, load)
+        self._mark_freshness(FRESHNESS_FRESH)
+        return self._copy(entry.value)
+    
+    def _iter_pages(self, kind: str, url: str, params: Dict[str, Any],
+                    format_items: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """Yield formatted items page by page; each page is fetched (and cached) only when reached"""
+        page_token = None
+        while True:
+            try:
+                page = self._get(kind, url, dict(params, pageToken=page_token), lambda data: {
+                    'items': format_items(data.get('items', [])),
+                    'next_page_token': data.get('nextPageToken')
+                })
+            except requests.RequestException as e:
+                raise Exception(f"YouTube API request failed: {str(e)}")
+            for item in page['items']:
+                yield dict(item)
+            page_token = page['next_page_token']
+            if not page_token or not page['items']:
+                return
+    
+    def _mark_freshness(self, freshness: str) -> None:
+        if data_freshness.get() != FRESHNESS_STALE:
+            data_freshness.set(freshness)
+    
+    def _refresh_in_background(self, key: str, load: Callable[[], CacheEntry]) -> None:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='youtube-refresh')
+        # Copy the context so the refresh is charged to the user whose request triggered it
+        self._refresh_executor.submit(contextvars.copy_context().run, self._refresh, key, load)
+    
+    def _refresh(self, key: str, load: Callable[[], CacheEntry]) -> None:
+        try:
+            self.single_flight.do(key, load)
+        except (requests.RequestException, QuotaExhaustedError, CircuitOpenError) as e:
+            logger.info("Background refresh of %s failed, keeping stale entry: %s", key, e)
+        except Exception:
+            logger.exception("Background refresh of %s failed", key)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+    
+    def _load(self, kind: str, key: str, url: str, params: Dict[str, Any], transform: Callable[[Dict[str, Any]], Any],
+              read_through: Optional[Callable[[], Optional[CacheEntry]]],
+              write_through: Optional[Callable[[Any], None]],
+              stale: Optional[CacheEntry] = None) -> CacheEntry:
+        if read_through is not None:
+            entry = read_through()
+            if entry is not None:
+                self.cache.set(key, entry)
+                self._index_videos(entry.value)
+                return entry
+        
+        # Revalidate an expired entry instead of downloading the full body again
+        headers = None
+        if stale is not None and stale.etag:
+            headers = {'If-None-Match': stale.etag}
+            with self._refresh_lock:
+                self._conditional_counters['revalidations'] += 1
+        response = self._send(kind, url, params, headers)
+        
+        if response.status_code == 304 and stale is not None:
+            with self._refresh_lock:
+                self._conditional_counters['not_modified'] += 1
+            entry = CacheEntry(
+                value=stale.value,
+                expires_at=time.time() + self.cache_ttls[kind],
+                size=stale.size,
+                etag=stale.etag
+            )
+        else:
+            data = response.json()
+            entry = CacheEntry(
+                value=transform(data),
+                expires_at=time.time() + self.cache_ttls[kind],
+                size=len(response.content),
+                etag=response.headers.get('ETag') or data.get('etag')
+            )
+            self._index_videos(entry.value)
+        self.cache.set(key, entry)
+        if write_through is not None:
+            write_through(entry.value)
+        return entry
+    
+    def _index_videos(self, value: Any) -> None:
+        """Add freshly fetched videos (a list, a page or a single video) to the content index"""
+        if self.content_index is None or not value:
+            return
+        if isinstance(value, dict):
+            value = value['items'] if 'items' in value else [value]
+        if isinstance(value, list) and value and 'video_id' in value[0]:
+            self.content_index.add_videos(value)
+    
+    def _send(self, kind: str, url: str, params: Dict[str, Any],
+              headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Check the circuit breaker, charge the call to the quota ledger, then GET it upstream"""
+        breaker = self.breakers[BREAKER_GROUPS[kind]]
+        if not breaker.allow():
+            raise CircuitOpenError(f"YouTube {breaker.name} API is unavailable, retry later")
+        try:
+            self.quota.spend(kind)
+        except QuotaExhaustedError:
+            breaker.release()
+            raise
+        try:
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        except requests.RequestException:
+            breaker.record_failure()
+            raise
+        if response.status_code == 429 or response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if response.status_code == 403 and self._is_quota_exceeded(response):
+            self.quota.mark_exhausted()
+        response.raise_for_status()
+        return response
+    
+    def _is_quota_exceeded(self, response: requests.Response) -> bool:
+        try:
+            errors = response.json().get('error', {}).get('errors', [])
+        except ValueError:
+            return False
+        return any(error.get('reason') in ('quotaExceeded', 'dailyLimitExceeded') for error in errors)
+    
+    def _video_params(self, video_id: str, rich: bool = False) -> Dict[str, Any]:
+        params = {
+            'part': 'snippet,statistics,contentDetails',
+            'id': video_id,
+            'key': self.api_key
+        }
+        if not rich:
+            params['fields'] = VIDEO_FIELDS
+        return params
+    
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        with self._batch_executor_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=self.config.YOUTUBE_BATCH_CONCURRENCY,
+                    thread_name_prefix='youtube-batch'
+                )
+        return self._batch_executor
+    
+    def _fetch_videos_chunk_once(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        key = cache_key('video-batch', self._video_params(','.join(video_ids)))
+        return self.single_flight.do(key, lambda: self._fetch_videos_chunk(video_ids))
+    
+    def _fetch_videos_chunk(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch up to 50 videos in one call and cache each one under its single-id key"""
+        response = self._send('video-batch', f"{self.base_url}/videos", self._video_params(','.join(video_ids)))
+        items = response.json().get('items', [])
+        fetched = {item['id']: self._format_video_details(item) for item in items}
+        self._index_videos(list(fetched.values()))
+        
+        expires_at = time.time() + self.cache_ttls['video']
+        size = len(response.content) // max(len(items), 1)
+        for video_id in video_ids:
+            # Unknown ids are cached as None, exactly like get_video_details does
+            self.cache.set(
+                cache_key('video', self._video_params(video_id)),
+                CacheEntry(value=fetched.get(video_id), expires_at=expires_at, size=size)
+            )
+        return fetched
+    
+    def _load_trending(self, region_code: str, category_id: int, max_results: int) -> Optional[CacheEntry]:
+        """Read a fresh trending chart from the shared table; a database error counts as a miss"""
+        try:
+            cached = self.trending_store.get_fresh(region_code, category_id, max_results, self.config.TRENDING_DB_CACHE_TTL)
+        except Exception as e:
+            logger.warning("Trending cache read failed: %s", e)
+            return None
+        if cached is None:
+            return None
+        videos, age = cached
+        # Never keep a shared row locally past the point it goes stale in the table
+        ttl = min(self.cache_ttls['trending'], self.config.TRENDING_DB_CACHE_TTL - age)
+        return CacheEntry(
+            value=videos,
+            expires_at=time.time() + max(ttl, 0),
+            size=len(json.dumps(videos))
+        )
+    
+    def _store_trending(self, region_code: str, category_id: int, videos: List[Dict[str, Any]]) -> None:
+        try:
+            self.trending_store.replace(region_code, category_id, videos)
+        except Exception as e:
+            logger.warning("Trending cache write failed: %s", e)
+    
+    def _copy(self, value: Any) -> Any:
+        # Videos carry nested tags/thumbnails; callers must never mutate the cached value
+        return copy.deepcopy(value)
+    
+    def _format_first_video(self, data: Dict[str, Any], rich: bool = False) -> Optional[Dict[str, Any]]:
+        items = data.get('items', [])
+        if items:
+            return self._format_video_details(items[0], rich)
+        return None
+    
+    def _format_categories(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [
+            {
+                'id': item['id'],
+                'title': item['snippet']['title'],
+                'assignable': item['snippet'].get('assignable', False)
+            }
+            for item in data.get('items', [])
+        ]
+    
     def _format_search_results(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Format search results to a consistent structure"""
         formatted_results = []
@@ -122,13 +561,13 @@ class YouTubeAPIService:
             })
         return formatted_results
     
-    def _format_video_details(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_video_details(self, item: Dict[str, Any], rich: bool = False) -> Dict[str, Any]:
         """Format video details to a consistent structure"""
         snippet = item.get('snippet', {})
         statistics = item.get('statistics', {})
         content_details = item.get('contentDetails', {})
         
-        return {
+        video = {
             'video_id': item['id'],
             'title': snippet.get('title', ''),
             'description': snippet.get('description', ''),
@@ -142,4 +581,19 @@ class YouTubeAPIService:
             'like_count': int(statistics.get('likeCount', 0)),
             'comment_count': int(statistics.get('commentCount', 0)),
             'tags': snippet.get('tags', [])
-        } 
\ No newline at end of file
+        }
+        if rich:
+            video.update({
+                'thumbnails': snippet.get('thumbnails', {}),
+                'category_id': snippet.get('categoryId', ''),
+                'default_language': snippet.get('defaultLanguage', ''),
+                'default_audio_language': snippet.get('defaultAudioLanguage', ''),
+                'localized': snippet.get('localized', {}),
+                'live_broadcast_content': snippet.get('liveBroadcastContent', ''),
+                'definition': content_details.get('definition', ''),
+                'dimension': content_details.get('dimension', ''),
+                'caption': content_details.get('caption', ''),
+                'licensed_content': content_details.get('licensedContent', False),
+                'favorite_count': int(statistics.get('favoriteCount', 0))
+            })
+        return video
@@ -0,0 +1,125 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    expires_at: float  # epoch seconds
+    size: int = 0  # approximate bytes, used for the memory cap
+    stored_at: float = field(default_factory=time.time)
+    etag: Optional[str] = None  # upstream ETag, sent back as If-None-Match to revalidate
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+
+class ResponseCache(ABC):
+    """Storage for formatted YouTube responses, keyed by normalized request parameters"""
+
+    @abstractmethod
+    def get(self, key: str, allow_stale: bool = False) -> Optional[CacheEntry]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        pass
+
+
+class LRUResponseCache(ResponseCache):
+    """In-process TTL cache with LRU eviction bounded by entry count and approximate bytes.
+    
+    Expired entries are kept for another ``stale_ttl`` seconds so callers can
+    serve them (``allow_stale=True``) while the upstream is refreshed or down.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024, stale_ttl: float = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters['misses'] += 1
+                return None
+            if not entry.is_fresh(now):
+                if now >= entry.expires_at + self.stale_ttl:
+                    self._remove(key)
+                    self._counters['expirations'] += 1
+                    self._counters['misses'] += 1
+                    return None
+                if not allow_stale:
+                    self._counters['misses'] += 1
+                    return None
+                self._counters['stale_hits'] += 1
+            else:
+                self._counters['hits'] += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if entry.size > self.max_bytes:
+                # Too big to cache; the older value must not keep being served either
+                return
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self._counters['evictions'] += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._counters['hits'] + self._counters['stale_hits'] + self._counters['misses']
+            return dict(
+                self._counters,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hit_ratio=round(self._counters['hits'] / lookups, 4) if lookups else 0.0
+            )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+def cache_key(kind: str, params: Dict[str, Any]) -> str:
+    """Build a stable cache key from the request kind and its parameters (API key excluded)"""
+    normalized = []
+    for name, value in sorted(params.items()):
+        if name == 'key' or value is None:
+            continue
+        value = str(value)
+        if name == 'q':
+            value = ' '.join(value.lower().split())
+        normalized.append((name, value))
+    return f"{kind}:{urlencode(normalized)}"
@@ -0,0 +1,188 @@
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+from ..config import Config
+from ..domain.repositories import YouTubeQuotaRepository
+
+logger = logging.getLogger(__name__)
+
+# Documented YouTube Data API v3 costs per call, keyed by the service's request kind
+QUOTA_COSTS = {
+    'search': 100,
+    'search-page': 100,
+    'video': 1,
+    'video-batch': 1,
+    'trending': 1,
+    'trending-page': 1,
+    'categories': 1
+}
+
+# YouTube resets the daily quota at midnight Pacific Time
+QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+MODE_NORMAL = 'normal'
+MODE_DEGRADED = 'degraded'
+MODE_CACHE_ONLY = 'cache_only'
+
+# User the current request spends quota for; set per request by the routes
+quota_user: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar('quota_user', default=None)
+
+
+class QuotaExhaustedError(Exception):
+    """Raised instead of calling YouTube when the daily budget does not allow the call"""
+
+
+def quota_day(now: Optional[datetime] = None) -> date:
+    return (now or datetime.now(QUOTA_TIMEZONE)).astimezone(QUOTA_TIMEZONE).date()
+
+
+class QuotaLedger:
+    """Charges every upstream YouTube call its quota cost against the daily budget.
+
+    Spend is kept per endpoint and per user for the current quota day and
+    synced with the youtube_quota_usage table every few seconds, so every
+    worker sees the spend of the others. As usage crosses the configured
+    ratios the ledger first stops expensive calls (degraded: search is served
+    from cache only) and then all upstream calls (cache_only).
+    """
+
+    def __init__(self, repository: Optional[YouTubeQuotaRepository] = None, daily_limit: Optional[int] = None,
+                 degraded_ratio: Optional[float] = None, cache_only_ratio: Optional[float] = None,
+                 sync_interval: Optional[float] = None):
+        config = Config()
+        self.repository = repository
+        self.daily_limit = daily_limit or config.YOUTUBE_DAILY_QUOTA
+        self.degraded_ratio = degraded_ratio or config.YOUTUBE_QUOTA_DEGRADED_RATIO
+        self.cache_only_ratio = cache_only_ratio or config.YOUTUBE_QUOTA_CACHE_ONLY_RATIO
+        self.sync_interval = sync_interval if sync_interval is not None else config.YOUTUBE_QUOTA_SYNC_INTERVAL
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._day = quota_day()
+        self._totals: Dict[Tuple[str, int], int] = defaultdict(int)
+        self._pending: Dict[Tuple[date, str, int], int] = defaultdict(int)
+        self._exhausted_day: Optional[date] = None
+        self._last_sync = 0.0
+
+    def spend(self, endpoint: str) -> None:
+        """Charge one call to ``endpoint``, raising QuotaExhaustedError if the budget does not allow it"""
+        self._maybe_sync()
+        cost = QUOTA_COSTS.get(endpoint, 1)
+        user_id = quota_user.get() or 0
+        with self._lock:
+            self._roll_over()
+            mode = self._mode()
+            used = sum(self._totals.values())
+            if mode == MODE_DEGRADED and cost > 1:
+                raise QuotaExhaustedError(f"YouTube quota nearly exhausted, {endpoint} is served from cache only")
+            if mode == MODE_CACHE_ONLY or used + cost > self.daily_limit:
+                raise QuotaExhaustedError("YouTube quota exhausted for today, only cached data is available")
+            self._totals[(endpoint, user_id)] += cost
+            self._pending[(self._day, endpoint, user_id)] += cost
+
+    def mark_exhausted(self) -> None:
+        """Switch to cache-only until the next quota day (YouTube answered quotaExceeded)"""
+        with self._lock:
+            self._roll_over()
+            self._exhausted_day = self._day
+
+    def mode(self) -> str:
+        with self._lock:
+            self._roll_over()
+            return self._mode()
+
+    def user_usage(self, user_id: int) -> Dict[str, int]:
+        """Units spent today on behalf of a user, per endpoint"""
+        with self._lock:
+            self._roll_over()
+            return {endpoint: units for (endpoint, uid), units in self._totals.items() if uid == user_id}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._roll_over()
+            by_endpoint: Dict[str, int] = defaultdict(int)
+            by_user: Dict[int, int] = defaultdict(int)
+            for (endpoint, user_id), units in self._totals.items():
+                by_endpoint[endpoint] += units
+                if user_id:
+                    by_user[user_id] += units
+            used = sum(by_endpoint.values())
+            top_users = sorted(by_user.items(), key=lambda item: item[1], reverse=True)[:20]
+            return {
+                'quota_day': self._day.isoformat(),
+                'daily_limit': self.daily_limit,
+                'used': used,
+                'remaining': max(self.daily_limit - used, 0),
+                'mode': self._mode(),
+                'by_endpoint': dict(by_endpoint),
+                'top_users': [{'user_id': user_id, 'units': units} for user_id, units in top_users]
+            }
+
+    def _mode(self) -> str:
+        if self._exhausted_day == self._day:
+            return MODE_CACHE_ONLY
+        used = sum(self._totals.values())
+        if used >= self.daily_limit * self.cache_only_ratio:
+            return MODE_CACHE_ONLY
+        if used >= self.daily_limit * self.degraded_ratio:
+            return MODE_DEGRADED
+        return MODE_NORMAL
+
+    def _roll_over(self) -> None:
+        today = quota_day()
+        if today != self._day:
+            self._day = today
+            self._totals = defaultdict(int)
+            self._last_sync = 0.0
+
+    def _maybe_sync(self) -> None:
+        if self.repository is None or time.monotonic() - self._last_sync < self.sync_interval:
+            return
+        # One thread syncs at a time; the others keep going on local totals
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            self._sync()
+        finally:
+            self._sync_lock.release()
+
+    def _sync(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            day = self._day
+        if pending:
+            try:
+                self.repository.add_usage(pending)
+            except Exception as e:
+                logger.warning("YouTube quota sync failed: %s", e)
+                # Nothing was written, so the units are retried on the next sync
+                with self._lock:
+                    for key, units in pending.items():
+                        self._pending[key] += units
+                    self._last_sync = time.monotonic()
+                return
+        try:
+            rows = self.repository.get_usage(day)
+        except Exception as e:
+            # The spend is stored; only the view of other workers' spend stays stale
+            logger.warning("YouTube quota refresh failed: %s", e)
+            with self._lock:
+                self._last_sync = time.monotonic()
+            return
+
+        with self._lock:
+            if day != self._day:
+                return
+            totals: Dict[Tuple[str, int], int] = defaultdict(int)
+            for row in rows:
+                totals[(row['endpoint'], row['user_id'])] += int(row['units'])
+            # Spend charged locally while the sync ran is not in the table yet
+            for (pending_day, endpoint, user_id), units in self._pending.items():
+                if pending_day == day:
+                    totals[(endpoint, user_id)] += units
+            self._totals = totals
+            self._last_sync = time.monotonic()
@@ -1,17 +1,218 @@
-from flask import jsonify, request
-from datetime import datetime
-from .infrastructure.database import DatabaseConnection
-from .domain.models import User, FavoriteVideo
+import atexit
+import json
+from itertools import islice
+from flask import Response, jsonify, request, stream_with_context
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional
+from .infrastructure.database import DatabaseConnection, get_pool
+from .infrastructure.metrics import database_metrics
+from .infrastructure.pagination import InvalidCursorError
+from .infrastructure.view_event_writer import ViewEventWriter, ViewBufferFullError
+from .domain.models import User, FavoriteVideo, TrendAnalysis, TrendAnalysisSummary, ViewHistory, Page
 from .use_cases.video_favoritos import FavoriteVideosUseCase
 from .use_cases.analisis_tendencias import TrendAnalysisUseCase
 from .use_cases.recomendaciones import RecommendationsUseCase
-from .infrastructure.youtube_api import YouTubeAPIService
+from .use_cases.perfil_intereses import InterestProfileUseCase
+from .infrastructure.circuit_breaker import CircuitOpenError
+from .infrastructure.content_index import ContentIndex
+from .infrastructure.recommendation_store import RecommendationStore
+from .infrastructure.seen_videos import SeenVideosCache
+from .infrastructure.youtube_api import FRESHNESS_STALE, PAGE_SIZE, YouTubeAPIService, data_freshness
+from .infrastructure.youtube_quota import QuotaExhaustedError, QuotaLedger, quota_user
 from .infrastructure.repositories.user_repository import MySQLUserRepository
 from .infrastructure.repositories.favorite_video_repository import MySQLFavoriteVideoRepository
 from .infrastructure.repositories.trend_analysis_repository import MySQLTrendAnalysisRepository
 from .infrastructure.repositories.view_history_repository import MySQLViewHistoryRepository
 from .infrastructure.repositories.user_preferences_repository import MySQLUserPreferencesRepository
+from .infrastructure.repositories.trending_videos_cache_repository import MySQLTrendingVideosCacheRepository
+from .infrastructure.repositories.youtube_quota_repository import MySQLYouTubeQuotaRepository
+from .infrastructure.repositories.user_interest_repository import MySQLUserInterestRepository
 from .infrastructure.auth_service import AuthService
+from .config import Config
+
+# Column limits of view_history; TIMESTAMP only covers 1970-2038
+VIDEO_ID_MAX_LENGTH = 20
+VIEW_TITLE_MAX_LENGTH = 500
+TIMESTAMP_MIN = datetime(1970, 1, 2)
+TIMESTAMP_MAX = datetime(2038, 1, 18)
+# Client clocks may run a little ahead; later view timestamps are rejected
+VIEWED_AT_MAX_SKEW = timedelta(minutes=5)
+
+def _favorite_to_dict(video: FavoriteVideo) -> Dict[str, Any]:
+    return {
+        "id": video.id,
+        "user_id": video.user_id,
+        "video_id": video.video_id,
+        "title": video.title,
+        "description": video.description,
+        "url": video.url,
+        "thumbnail": video.thumbnail,
+        "channel": video.channel,
+        "duration": video.duration,
+        "published_at": video.published_at.isoformat() if video.published_at else None,
+        "notes": video.notes,
+        "tags": video.tags,
+        "added_at": video.added_at.isoformat()
+    }
+
+def _favorite_from_payload(user_id: int, data: Dict[str, Any]) -> FavoriteVideo:
+    if not data.get('video_id'):
+        raise ValueError("video_id is required")
+    return FavoriteVideo(
+        id=0,
+        user_id=user_id,
+        video_id=data.get('video_id'),
+        title=data.get('title', ''),
+        description=data.get('description', ''),
+        url=data.get('url', ''),
+        thumbnail=data.get('thumbnail', ''),
+        channel=data.get('channel', ''),
+        duration=data.get('duration', ''),
+        published_at=datetime.fromisoformat(data.get('published_at', datetime.now().isoformat())),
+        notes=data.get('notes'),
+        tags=data.get('tags', [])
+    )
+
+def _view_from_payload(user_id: int, data: Dict[str, Any]) -> ViewHistory:
+    # Views are written behind the request, so anything the view_history columns
+    # would reject has to be caught here while the client can still be told
+    video_id = data.get('video_id')
+    if not video_id or not isinstance(video_id, str):
+        raise ValueError("video_id is required")
+    if len(video_id) > VIDEO_ID_MAX_LENGTH:
+        raise ValueError(f"video_id must be at most {VIDEO_ID_MAX_LENGTH} characters")
+    title = data.get('title') or ''
+    if not isinstance(title, str) or len(title) > VIEW_TITLE_MAX_LENGTH:
+        raise ValueError(f"title must be a string of at most {VIEW_TITLE_MAX_LENGTH} characters")
+    try:
+        viewed_at = datetime.fromisoformat(data['viewed_at']) if data.get('viewed_at') else datetime.now()
+        view_duration = int(data.get('view_duration', 0))
+    except (TypeError, ValueError):
+        raise ValueError("viewed_at must be an ISO 8601 datetime and view_duration an integer")
+    if viewed_at.tzinfo is not None:
+        viewed_at = viewed_at.astimezone().replace(tzinfo=None)
+    if not TIMESTAMP_MIN <= viewed_at <= TIMESTAMP_MAX:
+        raise ValueError("viewed_at is out of range")
+    now = datetime.now()
+    if viewed_at > now + VIEWED_AT_MAX_SKEW:
+        raise ValueError("viewed_at must not be in the future")
+    viewed_at = min(viewed_at, now)
+    if view_duration < 0:
+        raise ValueError("view_duration must not be negative")
+    return ViewHistory(
+        id=0,
+        user_id=user_id,
+        video_id=video_id,
+        title=title,
+        viewed_at=viewed_at,
+        view_duration=view_duration,
+        completed=bool(data.get('completed', False))
+    )
+
+def _user_id_from_payload(data: Any) -> int:
+    if not isinstance(data, dict):
+        raise ValueError("Request body must be a JSON object")
+    user_id = data.get('user_id')
+    if isinstance(user_id, bool):
+        raise ValueError("user_id must be an integer")
+    try:
+        return int(user_id)
+    except (TypeError, ValueError):
+        raise ValueError("user_id must be an integer")
+
+def _parse_bulk_items(data: Dict[str, Any], parse: Callable[[int, Dict[str, Any]], Any]):
+    """Validate a bulk payload, returning (user_id, [(index, entity)], [per-item errors])"""
+    user_id = _user_id_from_payload(data)
+    items = data.get('items')
+    if not isinstance(items, list) or not items:
+        raise ValueError("items must be a non-empty array")
+    if len(items) > Config.BULK_MAX_ITEMS:
+        raise ValueError(f"At most {Config.BULK_MAX_ITEMS} items are accepted per request")
+    parsed = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            parsed.append((index, parse(user_id, item)))
+        except Exception as e:
+            errors.append({"index": index, "status": "invalid", "error": str(e)})
+    return user_id, parsed, errors
+
+def _view_history_to_dict(history: ViewHistory) -> Dict[str, Any]:
+    return {
+        "id": history.id,
+        "user_id": history.user_id,
+        "video_id": history.video_id,
+        "title": history.title,
+        "viewed_at": history.viewed_at.isoformat() if history.viewed_at else None,
+        "view_duration": history.view_duration,
+        "completed": bool(history.completed)
+    }
+
+def _trend_analysis_to_dict(analysis: TrendAnalysis) -> Dict[str, Any]:
+    return {
+        "id": analysis.id,
+        "user_id": analysis.user_id,
+        "category": analysis.category,
+        "region": analysis.region,
+        "analyzed_at": analysis.analyzed_at.isoformat() if analysis.analyzed_at else None,
+        "results": analysis.results,
+        "criteria": analysis.criteria
+    }
+
+def _trend_analysis_summary_to_dict(summary: TrendAnalysisSummary) -> Dict[str, Any]:
+    return {
+        "id": summary.id,
+        "user_id": summary.user_id,
+        "category": summary.category,
+        "region": summary.region,
+        "analyzed_at": summary.analyzed_at.isoformat() if summary.analyzed_at else None,
+        "statistics": summary.statistics,
+        "total_videos": summary.total_videos,
+        "criteria": summary.criteria
+    }
+
+def _stream_json_list(key: str, items: Iterable[Any], serialize: Callable[[Any], Dict[str, Any]]) -> Response:
+    """Stream a {"success": true, key: [...]} document as chunked JSON.
+
+    The first item is pulled before the response starts so that connection or
+    query errors still surface as a regular 500 instead of a truncated body.
+    """
+    iterator = iter(items)
+    first = next(iterator, None)
+
+    def generate():
+        yield '{"success": true, "%s": [' % key
+        if first is not None:
+            yield json.dumps(serialize(first))
+            for item in iterator:
+                yield ',' + json.dumps(serialize(item))
+        yield ']}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+def _page_response(key: str, page: Page, serialize: Callable[[Any], Dict[str, Any]]) -> Response:
+    return jsonify({
+        "success": True,
+        key: [serialize(item) for item in page.items],
+        "next_cursor": page.next_cursor,
+        "has_more": page.next_cursor is not None
+    })
+
+def _request_user_id() -> Optional[int]:
+    """user_id of the current request from the query string or JSON body, if any"""
+    user_id = request.args.get('user_id')
+    if user_id is None and request.is_json:
+        payload = request.get_json(silent=True)
+        if isinstance(payload, dict):
+            user_id = payload.get('user_id')
+    try:
+        return int(user_id) if user_id is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def _wants_page() -> bool:
+    """Listing endpoints stream everything unless the client asks for a page"""
+    return 'limit' in request.args or 'cursor' in request.args
 
 def register_routes(app):
     # Initialize repositories
@@ -20,15 +221,66 @@ def register_routes(app):
     trend_analysis_repo = MySQLTrendAnalysisRepository()
     view_history_repo = MySQLViewHistoryRepository()
     user_preferences_repo = MySQLUserPreferencesRepository()
+    trending_videos_cache_repo = MySQLTrendingVideosCacheRepository()
+    
+    # Interest profiles are updated incrementally as views, favorites and preferences arrive
+    interest_profiles_use_case = InterestProfileUseCase(MySQLUserInterestRepository())
     
     # Initialize services
-    youtube_service = YouTubeAPIService()
+    youtube_quota = QuotaLedger(MySQLYouTubeQuotaRepository())
+    # Local index of every video fetched, used to rank recommendations without search quota
+    content_index = ContentIndex(max_documents=Config.CONTENT_INDEX_MAX_VIDEOS)
+    youtube_service = YouTubeAPIService(trending_store=trending_videos_cache_repo, quota=youtube_quota,
+                                        content_index=content_index)
     auth_service = AuthService()
     
     # Initialize use cases
     favorite_videos_use_case = FavoriteVideosUseCase(favorite_video_repo, youtube_service)
     trend_analysis_use_case = TrendAnalysisUseCase(trend_analysis_repo, youtube_service)
-    recommendations_use_case = RecommendationsUseCase(view_history_repo, user_preferences_repo, youtube_service)
+    recommendations_use_case = RecommendationsUseCase(
+        view_history_repo,
+        user_preferences_repo,
+        favorite_video_repo,
+        youtube_service,
+        content_index=content_index,
+        recommendation_store=RecommendationStore(
+            ttl=Config.RECOMMENDATION_CACHE_TTL,
+            max_users=Config.RECOMMENDATION_CACHE_MAX_USERS,
+            max_bytes=Config.RECOMMENDATION_CACHE_MAX_BYTES
+        ),
+        seen_videos=SeenVideosCache(
+            loader=view_history_repo.get_video_ids_by_user,
+            ttl=Config.SEEN_VIDEOS_CACHE_TTL,
+            max_users=Config.SEEN_VIDEOS_CACHE_MAX_USERS,
+            max_bytes=Config.SEEN_VIDEOS_CACHE_MAX_BYTES
+        ),
+        interest_profiles=interest_profiles_use_case
+    )
+    
+    def views_written(histories):
+        """Keep seen-sets and interest profiles current once views are stored"""
+        recommendations_use_case.mark_watched(histories)
+        interest_profiles_use_case.record_views(histories)
+    
+    # View events are written behind the request in batches; flush what is left on shutdown
+    view_event_writer = ViewEventWriter(view_history_repo, on_written=views_written)
+    atexit.register(view_event_writer.close)
+    
+    @app.before_request
+    def attribute_youtube_quota():
+        """Charge YouTube calls made while serving this request to its user"""
+        quota_user.set(_request_user_id())
+        data_freshness.set(None)
+    
+    @app.after_request
+    def add_data_freshness(response):
+        """Tell clients when YouTube data in the response was served stale"""
+        freshness = data_freshness.get()
+        if freshness:
+            response.headers['X-Data-Freshness'] = freshness
+            if freshness == FRESHNESS_STALE:
+                response.headers['Warning'] = '110 - "Response is Stale"'
+        return response
     
     @app.route("/test", methods=["GET"])
     def test():
@@ -45,6 +297,44 @@ def register_routes(app):
         except Exception as e:
             return jsonify({"status": "error", "message": str(e)}), 500
     
+    @app.route("/api/v1/metrics/database", methods=["GET"])
+    def get_database_metrics():
+        """Per-repository query latency histograms, pool wait times and slow-query log"""
+        try:
+            return jsonify({
+                "success": True,
+                "pool": get_pool().stats(),
+                "metrics": database_metrics.snapshot(),
+                "view_writer": view_event_writer.stats()
+            })
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/v1/metrics/youtube", methods=["GET"])
+    def get_youtube_metrics():
+        """YouTube response cache, request coalescing, quota and circuit breaker counters"""
+        try:
+            return jsonify({
+                "success": True,
+                "cache": youtube_service.cache_stats(),
+                "single_flight": youtube_service.single_flight_stats(),
+                "breakers": youtube_service.breaker_stats(),
+                "conditional": youtube_service.conditional_stats(),
+                "content_index": content_index.stats(),
+                "quota": youtube_service.quota_stats()
+            })
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/v1/metrics/youtube/quota/<int:user_id>", methods=["GET"])
+    def get_youtube_user_quota(user_id):
+        """YouTube quota units spent today on behalf of a user, per endpoint"""
+        try:
+            usage = youtube_quota.user_usage(user_id)
+            return jsonify({"success": True, "user_id": user_id, "used": sum(usage.values()), "by_endpoint": usage})
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
     # Simple registration endpoint
     @app.route("/api/auth/register", methods=["POST"])
     def register():
@@ -85,30 +375,23 @@ def register_routes(app):
     # Favorites endpoints (user_id required)
     @app.route("/api/favorites", methods=["GET"])
     def get_favorites():
-        """Get user's favorite videos"""
+        """Get all of the user's favorite videos, or one page when limit/cursor is given"""
         try:
             user_id = int(request.args.get('user_id'))
+            if _wants_page():
+                page = favorite_video_repo.get_page_by_user(
+                    user_id,
+                    limit=request.args.get('limit', type=int),
+                    cursor=request.args.get('cursor')
+                )
+                return _page_response("favorites", page, _favorite_to_dict)
             videos = favorite_video_repo.get_by_user(user_id)
             return jsonify({
                 "success": True,
-                "favorites": [
-                    {
-                        "id": video.id,
-                        "user_id": video.user_id,
-                        "video_id": video.video_id,
-                        "title": video.title,
-                        "description": video.description,
-                        "url": video.url,
-                        "thumbnail": video.thumbnail,
-                        "channel": video.channel,
-                        "duration": video.duration,
-                        "published_at": video.published_at.isoformat() if video.published_at else None,
-                        "notes": video.notes,
-                        "tags": video.tags,
-                        "added_at": video.added_at.isoformat()
-                    } for video in videos
-                ]
+                "favorites": [_favorite_to_dict(video) for video in videos]
             })
+        except InvalidCursorError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
@@ -118,39 +401,81 @@ def register_routes(app):
         try:
             data = request.get_json()
             user_id = int(data.get('user_id'))
-            video = FavoriteVideo(
-                id=0,
-                user_id=user_id,
-                video_id=data.get('video_id'),
-                title=data.get('title', ''),
-                description=data.get('description', ''),
-                url=data.get('url', ''),
-                thumbnail=data.get('thumbnail', ''),
-                channel=data.get('channel', ''),
-                duration=data.get('duration', ''),
-                published_at=datetime.fromisoformat(data.get('published_at', datetime.now().isoformat())),
-                notes=data.get('notes'),
-                tags=data.get('tags', [])
-            )
-            video = favorite_video_repo.create(video)
+            video = favorite_video_repo.create(_favorite_from_payload(user_id, data))
+            interest_profiles_use_case.record_favorites([video])
+            recommendations_use_case.invalidate_recommendations(user_id)
             return jsonify({"success": True, "message": "Video added to favorites", "favorite_id": video.id}), 201
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
+    @app.route("/api/favorites/bulk", methods=["POST"])
+    def add_favorite_videos_bulk():
+        """Add many videos to user's favorites in one transaction, reporting a result per item"""
+        try:
+            user_id, parsed, results = _parse_bulk_items(request.get_json(silent=True), _favorite_from_payload)
+            videos = [video for _, video in parsed]
+            created_flags = favorite_video_repo.create_many(videos)
+            if any(created_flags):
+                interest_profiles_use_case.record_favorites(
+                    [video for video, created in zip(videos, created_flags) if created])
+                recommendations_use_case.invalidate_recommendations(user_id)
+            for (index, video), created in zip(parsed, created_flags):
+                results.append({
+                    "index": index,
+                    "video_id": video.video_id,
+                    "status": "created" if created else "duplicate",
+                    "favorite_id": video.id
+                })
+            results.sort(key=lambda result: result["index"])
+            return jsonify({
+                "success": True,
+                "created": sum(1 for created in created_flags if created),
+                "results": results
+            }), 201
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/favorites/bulk", methods=["DELETE"])
+    def remove_favorite_videos_bulk():
+        """Remove many videos from user's favorites in one statement"""
+        try:
+            data = request.get_json(silent=True)
+            user_id = _user_id_from_payload(data)
+            video_ids = data.get('video_ids')
+            if not isinstance(video_ids, list) or not video_ids:
+                return jsonify({"error": "video_ids must be a non-empty array"}), 400
+            if len(video_ids) > Config.BULK_MAX_ITEMS:
+                return jsonify({"error": f"At most {Config.BULK_MAX_ITEMS} items are accepted per request"}), 400
+            deleted = favorite_video_repo.delete_many_by_user_and_videos(user_id, list(dict.fromkeys(video_ids)))
+            if deleted:
+                recommendations_use_case.invalidate_recommendations(user_id)
+            return jsonify({"success": True, "message": "Videos removed from favorites", "deleted": deleted})
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/favorites/refresh", methods=["POST"])
+    def refresh_favorite_videos():
+        """Refresh the YouTube metadata of all the user's favorites"""
+        try:
+            data = request.get_json()
+            user_id = int(data.get('user_id'))
+            updated = favorite_videos_use_case.refresh_favorites_metadata(user_id)
+            return jsonify({"success": True, "updated": len(updated), "favorites": [_favorite_to_dict(video) for video in updated]})
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
     @app.route("/api/favorites/<video_id>", methods=["DELETE"])
     def remove_favorite_video(video_id):
         """Remove a video from user's favorites"""
         try:
             user_id = int(request.args.get('user_id'))
-            favorites = favorite_video_repo.get_by_user(user_id)
-            favorite_to_delete = None
-            for fav in favorites:
-                if fav.video_id == video_id:
-                    favorite_to_delete = fav
-                    break
-            if not favorite_to_delete:
+            if not favorite_video_repo.delete_by_user_and_video(user_id, video_id):
                 return jsonify({"error": "Favorite not found"}), 404
-            favorite_video_repo.delete(favorite_to_delete.id)
+            recommendations_use_case.invalidate_recommendations(user_id)
             return jsonify({"success": True, "message": "Video removed from favorites"})
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -163,16 +488,56 @@ def register_routes(app):
             user_id = int(request.args.get('user_id'))
             region = request.args.get('region', 'AR')
             category = request.args.get('category', '0')
+            if not category.isdigit():
+                return jsonify({"error": "category must be a numeric YouTube category id"}), 400
             max_results = int(request.args.get('max_results', 10))
             videos = youtube_service.get_trending_videos(region, category, max_results)
             return jsonify({
                 "success": True,
                 "trends": videos,
+                "freshness": data_freshness.get(),
                 "region": region,
                 "category": category,
                 "total": len(videos),
                 "user_id": user_id
             })
+        except (QuotaExhaustedError, CircuitOpenError) as e:
+            return jsonify({"error": str(e)}), 503
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/trends/analyses", methods=["GET"])
+    def get_trend_analyses():
+        """List the user's saved trend analyses (metadata and statistics only).
+
+        Streams every analysis, or returns one page when limit/cursor is given.
+        Full results are served by /api/trends/analyses/<analysis_id>.
+        """
+        try:
+            user_id = int(request.args.get('user_id'))
+            if _wants_page():
+                page = trend_analysis_repo.get_summary_page_by_user(
+                    user_id,
+                    limit=request.args.get('limit', type=int),
+                    cursor=request.args.get('cursor')
+                )
+                return _page_response("analyses", page, _trend_analysis_summary_to_dict)
+            return _stream_json_list("analyses", trend_analysis_repo.iter_summaries_by_user(user_id),
+                                     _trend_analysis_summary_to_dict)
+        except InvalidCursorError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/trends/analyses/<int:analysis_id>", methods=["GET"])
+    def get_trend_analysis(analysis_id):
+        """Get one of the user's trend analyses including its full results"""
+        try:
+            user_id = int(request.args.get('user_id'))
+            analysis = trend_analysis_repo.get_by_id(analysis_id)
+            if not analysis or analysis.user_id != user_id:
+                return jsonify({"error": "Analysis not found"}), 404
+            return jsonify({"success": True, "analysis": _trend_analysis_to_dict(analysis)})
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
@@ -184,10 +549,12 @@ def register_routes(app):
             user_id = int(request.args.get('user_id'))
             max_results = int(request.args.get('max_results', 10))
             recommendations = recommendations_use_case.get_recommendations(user_id=user_id, max_results=max_results)
+            generated_at = recommendations_use_case.recommendations_generated_at(user_id)
             return jsonify({
                 "success": True,
                 "recommendations": recommendations,
-                "total": len(recommendations)
+                "total": len(recommendations),
+                "generated_at": generated_at.isoformat() if generated_at else None
             })
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -207,6 +574,9 @@ def register_routes(app):
                 min_duration=data.get('min_duration'),
                 max_duration=data.get('max_duration')
             )
+            interest_profiles_use_case.record_preferences(user_id, topics=data.get('topics', []),
+                                                         genres=data.get('genres', []))
+            recommendations_use_case.invalidate_recommendations(user_id)
             return jsonify({"success": True, "message": "Preferences updated successfully"})
         except Exception as e:
             return jsonify({"error": str(e)}), 500
@@ -214,18 +584,55 @@ def register_routes(app):
     # View history endpoints (user_id required)
     @app.route("/api/recommendations/view", methods=["POST"])
     def record_view():
-        """Record a video view for the user"""
+        """Queue a video view for the user; it is persisted by the batched writer"""
         try:
-            data = request.get_json()
-            user_id = int(data.get('user_id'))
-            view_history_repo.record_view(
-                user_id=user_id,
-                video_id=data.get('video_id'),
-                title=data.get('title', ''),
-                view_duration=data.get('view_duration', 0),
-                completed=data.get('completed', False)
-            )
-            return jsonify({"success": True, "message": "View recorded successfully"})
+            data = request.get_json(silent=True)
+            user_id = _user_id_from_payload(data)
+            view_event_writer.submit(_view_from_payload(user_id, data))
+            return jsonify({"success": True, "message": "View queued for recording"}), 202
+        except ViewBufferFullError as e:
+            return jsonify({"error": str(e)}), 503
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/recommendations/history", methods=["GET"])
+    def get_view_history():
+        """Stream the user's view history, or return one page when limit/cursor is given"""
+        try:
+            user_id = int(request.args.get('user_id'))
+            if _wants_page():
+                page = view_history_repo.get_page_by_user(
+                    user_id,
+                    limit=request.args.get('limit', type=int),
+                    cursor=request.args.get('cursor')
+                )
+                return _page_response("history", page, _view_history_to_dict)
+            return _stream_json_list("history", view_history_repo.iter_by_user(user_id), _view_history_to_dict)
+        except InvalidCursorError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    
+    @app.route("/api/recommendations/view/bulk", methods=["POST"])
+    def record_views_bulk():
+        """Record many video views in one transaction, reporting a result per item"""
+        try:
+            user_id, parsed, results = _parse_bulk_items(request.get_json(silent=True), _view_from_payload)
+            histories = [history for _, history in parsed]
+            view_history_repo.create_many(histories)
+            views_written(histories)
+            for index, history in parsed:
+                results.append({"index": index, "video_id": history.video_id, "status": "recorded"})
+            results.sort(key=lambda result: result["index"])
+            return jsonify({
+                "success": True,
+                "recorded": len(parsed),
+                "results": results
+            }), 201
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
@@ -235,11 +642,16 @@ def register_routes(app):
         """Search YouTube videos (public endpoint)"""
         try:
             query = request.args.get('q', '')
-            max_results = int(request.args.get('max_results', 10))
+            max_results = min(int(request.args.get('max_results', 10)), Config.YOUTUBE_MAX_RESULTS)
             if not query:
                 return jsonify({"error": "Query parameter 'q' is required"}), 400
+            if max_results > PAGE_SIZE:
+                # More than one page: stream results as each page arrives
+                return _stream_json_list("videos", islice(youtube_service.iter_search_videos(query), max_results), dict)
             videos = youtube_service.search_videos(query, max_results)
-            return jsonify({"success": True, "videos": videos})
+            return jsonify({"success": True, "videos": videos, "freshness": data_freshness.get()})
+        except (QuotaExhaustedError, CircuitOpenError) as e:
+            return jsonify({"error": str(e)}), 503
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
@@ -247,11 +659,14 @@ def register_routes(app):
     def get_video_details(video_id):
         """Get YouTube video details (public endpoint)"""
         try:
-            video = youtube_service.get_video_details(video_id)
+            rich = request.args.get('rich', 'false').lower() == 'true'
+            video = youtube_service.get_video_details(video_id, rich=rich)
             if video:
-                return jsonify({"success": True, "video": video})
+                return jsonify({"success": True, "video": video, "freshness": data_freshness.get()})
             else:
                 return jsonify({"error": "Video not found"}), 404
+        except (QuotaExhaustedError, CircuitOpenError) as e:
+            return jsonify({"error": str(e)}), 503
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
@@ -260,9 +675,15 @@ def register_routes(app):
         """Get trending videos (public endpoint)"""
         try:
             region = request.args.get('region', 'AR')
-            max_results = int(request.args.get('max_results', 10))
-            videos = youtube_service.get_trending_videos(region, max_results=max_results)
-            return jsonify({"success": True, "videos": videos})
+            max_results = min(int(request.args.get('max_results', 10)), Config.YOUTUBE_MAX_RESULTS)
+            rich = request.args.get('rich', 'false').lower() == 'true'
+            if max_results > PAGE_SIZE:
+                videos = islice(youtube_service.iter_trending_videos(region, rich=rich), max_results)
+                return _stream_json_list("videos", videos, dict)
+            videos = youtube_service.get_trending_videos(region, max_results=max_results, rich=rich)
+            return jsonify({"success": True, "videos": videos, "freshness": data_freshness.get()})
+        except (QuotaExhaustedError, CircuitOpenError) as e:
+            return jsonify({"error": str(e)}), 503
         except Exception as e:
             return jsonify({"error": str(e)}), 500
     
@@ -272,6 +693,8 @@ def register_routes(app):
         try:
             region = request.args.get('region', 'AR')
             categories = youtube_service.get_video_categories(region)
-            return jsonify({"success": True, "categories": categories})
+            return jsonify({"success": True, "categories": categories, "freshness": data_freshness.get()})
+        except (QuotaExhaustedError, CircuitOpenError) as e:
+            return jsonify({"error": str(e)}), 503
         except Exception as e:
             return jsonify({"error": str(e)}), 500 
\ No newline at end of file
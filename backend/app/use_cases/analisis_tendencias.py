@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from itertools import islice
 from ..domain.models import TrendAnalysis
 from ..domain.repositories import TrendAnalysisRepository
 from ..infrastructure.youtube_api import YouTubeAPIService
@@ -11,8 +12,8 @@ class TrendAnalysisUseCase:
     
     def create_trend_analysis(self, user_id: int, category: str, region: str = "US", max_results: int = 20) -> TrendAnalysis:
         """Create a new trend analysis for a specific category"""
-        # Get trending videos from YouTube API
-        trending_videos = self.youtube_service.get_trending_videos(region, None, max_results)
+        # Get trending videos from YouTube API, fetching only as many pages as needed
+        trending_videos = list(islice(self.youtube_service.iter_trending_videos(region), max_results))
         
         # Calculate statistics
         statistics = self._calculate_statistics(trending_videos)
@@ -0,0 +1,123 @@
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..config import Config
+from ..domain.models import FavoriteVideo, ViewHistory
+from ..domain.repositories import UserInterestRepository
+from ..domain.terms import tokenize, video_terms
+
+logger = logging.getLogger(__name__)
+
+# Weights are stored scaled to this instant (see _scale)
+WEIGHT_EPOCH = datetime(2024, 1, 1)
+
+# How much each kind of signal adds to the terms it carries
+VIEW_WEIGHT = 0.5
+COMPLETED_VIEW_WEIGHT = 1.0
+FAVORITE_WEIGHT = 2.0
+PREFERENCE_WEIGHT = 5.0
+
+# Longest term the profile table stores (user_interest_terms.term)
+MAX_TERM_LENGTH = 64
+
+# A profile is trimmed back to INTEREST_MAX_STORED_TERMS once this share of that many
+# term updates has been written for the user since the last trim
+PRUNE_GROWTH_RATIO = 0.25
+
+
+class InterestProfileUseCase:
+    """Incrementally maintained, time-decayed keyword profile per user.
+    
+    Every view, favorite and preference update adds weight to the terms it
+    carries; weights halve every INTEREST_HALF_LIFE_DAYS. Instead of decaying
+    stored rows, increments are scaled up by 2^(age of the epoch / half-life)
+    when written, which keeps updates purely additive (safe across workers)
+    and makes the ranking by stored weight the ranking by decayed weight.
+    Reading a profile is a single indexed top-N query, no history scan.
+    """
+    
+    def __init__(self, interest_repo: UserInterestRepository, half_life_days: Optional[float] = None,
+                 max_stored_terms: Optional[int] = None):
+        config = Config()
+        self.interest_repo = interest_repo
+        self.half_life_seconds = (half_life_days or config.INTEREST_HALF_LIFE_DAYS) * 86400
+        self.max_stored_terms = max_stored_terms or config.INTEREST_MAX_STORED_TERMS
+        # Term updates written per user since their profile was last trimmed
+        self._writes_since_prune: Dict[int, int] = defaultdict(int)
+        self._prune_lock = threading.Lock()
+    
+    def record_views(self, histories: Iterable[ViewHistory]) -> None:
+        """Add the titles of watched videos; completed views count double"""
+        increments: Dict[Tuple[int, str], float] = defaultdict(float)
+        now = datetime.now()
+        for history in histories:
+            weight = COMPLETED_VIEW_WEIGHT if history.completed else VIEW_WEIGHT
+            # A future timestamp would outweigh every real signal for good; never scale past now
+            scale = self._scale(min(history.viewed_at or now, now))
+            for token in tokenize(history.title):
+                increments[(history.user_id, token)] += weight * scale
+        self._apply(increments)
+    
+    def record_favorites(self, videos: Iterable[FavoriteVideo]) -> None:
+        """Add the title, tags, channel and description terms of newly favorited videos"""
+        increments: Dict[Tuple[int, str], float] = defaultdict(float)
+        scale = self._scale(datetime.now())
+        for video in videos:
+            terms = video_terms({
+                'title': video.title,
+                'description': video.description,
+                'channel_title': video.channel,
+                'tags': video.tags
+            })
+            for term, count in terms.items():
+                increments[(video.user_id, term)] += FAVORITE_WEIGHT * count * scale
+        self._apply(increments)
+    
+    def record_preferences(self, user_id: int, topics: Optional[List[str]] = None,
+                           genres: Optional[List[str]] = None) -> None:
+        """Add the user's declared topics and genres with a strong weight"""
+        increments: Dict[Tuple[int, str], float] = defaultdict(float)
+        scale = self._scale(datetime.now())
+        for phrase in (topics or []) + (genres or []):
+            for token in tokenize(phrase):
+                increments[(user_id, token)] += PREFERENCE_WEIGHT * scale
+        self._apply(increments)
+    
+    def top_terms(self, user_id: int, limit: int = 20) -> Dict[str, float]:
+        """Current (decayed) weight of the user's heaviest terms, heaviest first"""
+        scale = self._scale(datetime.now())
+        return {term: weight / scale for term, weight in self.interest_repo.get_top_terms(user_id, limit)}
+    
+    def _scale(self, at: Optional[datetime]) -> float:
+        # Grows 2x per half-life and overflows a float after ~1000 half-lives (about 38 years
+        # at 14 days); move WEIGHT_EPOCH forward and rescale stored weights well before that
+        elapsed = ((at or datetime.now()) - WEIGHT_EPOCH).total_seconds()
+        return 2.0 ** (elapsed / self.half_life_seconds)
+    
+    def _apply(self, increments: Dict[Tuple[int, str], float]) -> None:
+        # A profile update must never fail the write that triggered it
+        increments = {key: weight for key, weight in increments.items() if len(key[1]) <= MAX_TERM_LENGTH}
+        if not increments:
+            return
+        try:
+            self.interest_repo.add_weights(increments)
+            for user_id in self._due_for_pruning(increments):
+                self.interest_repo.prune(user_id, self.max_stored_terms)
+        except Exception as e:
+            logger.warning("Updating interest profiles failed: %s", e)
+    
+    def _due_for_pruning(self, increments: Dict[Tuple[int, str], float]) -> List[int]:
+        # Each term update adds at most one stored term, so counting them bounds
+        # how far a profile can have grown past max_stored_terms
+        threshold = max(1, int(self.max_stored_terms * PRUNE_GROWTH_RATIO))
+        due = []
+        with self._prune_lock:
+            for user_id, _ in increments:
+                self._writes_since_prune[user_id] += 1
+            for user_id in {user_id for user_id, _ in increments}:
+                if self._writes_since_prune[user_id] >= threshold:
+                    del self._writes_since_prune[user_id]
+                    due.append(user_id)
+        return due
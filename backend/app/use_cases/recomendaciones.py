@@ -1,19 +1,53 @@
+import contextvars
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-from ..domain.models import ViewHistory, UserPreferences
-from ..domain.repositories import ViewHistoryRepository, UserPreferencesRepository
+from ..config import Config
+from ..domain.models import FavoriteVideo, ViewHistory, UserPreferences
+from ..domain.ports import RecommendationCache, SeenVideosStore, VideoIndex
+from ..domain.repositories import FavoriteVideoRepository, ViewHistoryRepository, UserPreferencesRepository
+from ..domain.terms import video_terms
+from .perfil_intereses import InterestProfileUseCase
 from ..infrastructure.youtube_api import YouTubeAPIService
-from ..infrastructure.repositories.favorite_video_repository import MySQLFavoriteVideoRepository
+
+logger = logging.getLogger(__name__)
+
+# Distinct terms of the interest profile used to rank candidates
+PROFILE_MAX_TERMS = 50
 
 class RecommendationsUseCase:
     def __init__(self, history_repo: ViewHistoryRepository, 
                  preferences_repo: UserPreferencesRepository, 
-                 youtube_service: YouTubeAPIService):
+                 favorite_repo: FavoriteVideoRepository,
+                 youtube_service: YouTubeAPIService,
+                 content_index: VideoIndex,
+                 recommendation_store: RecommendationCache,
+                 seen_videos: SeenVideosStore,
+                 interest_profiles: InterestProfileUseCase):
         self.history_repo = history_repo
         self.preferences_repo = preferences_repo
+        self.favorite_repo = favorite_repo
         self.youtube_service = youtube_service
-        # Acceso directo al repo de favoritos
-        self.favorite_repo = MySQLFavoriteVideoRepository()
+        self.content_index = content_index
+        self.recommendation_store = recommendation_store
+        # Watched videos are never recommended; the set is updated as views are recorded
+        self.seen_videos = seen_videos
+        self.interest_profiles = interest_profiles
+        config = Config()
+        self.deadline = config.RECOMMENDATION_DEADLINE
+        # Shared by every request so concurrent searches stay bounded process-wide
+        self.search_executor = ThreadPoolExecutor(
+            max_workers=config.RECOMMENDATION_FANOUT_WORKERS,
+            thread_name_prefix='recommendation-search'
+        )
+        # Recomputes after favorites/preferences change run one at a time, off the request path
+        self.refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='recommendation-refresh')
+        self._refresh_lock = threading.Lock()
+        self._refreshing = set()
+        self._dirty = set()
     
     def register_view(self, user_id: int, video_id: str, title: str, 
                      view_duration: int, completed: bool = False) -> ViewHistory:
@@ -28,29 +62,108 @@ class RecommendationsUseCase:
             completed=completed
         )
         
-        return self.history_repo.create(history)
+        history = self.history_repo.create(history)
+        self.mark_watched([history])
+        self.interest_profiles.record_views([history])
+        return history
+    
+    def mark_watched(self, histories: List[ViewHistory]) -> None:
+        """Exclude freshly watched videos from the users' recommendations"""
+        video_ids_by_user: Dict[int, set] = {}
+        for history in histories:
+            video_ids_by_user.setdefault(history.user_id, set()).add(history.video_id)
+        for user_id, video_ids in video_ids_by_user.items():
+            self.seen_videos.add(user_id, video_ids)
     
     def get_recommendations(self, user_id: int, max_results: int = 10) -> List[Dict[str, Any]]:
-        """Get personalized video recommendations for a user (solo si tiene favoritos)"""
+        """Get personalized video recommendations for a user (solo si tiene favoritos).
+        
+        Served from the per-user store while it is fresh and was generated for
+        at least ``max_results`` videos; otherwise computed and stored. Videos
+        watched since they were stored are dropped, and recomputed once that
+        leaves the list short.
+        """
+        stored = self.recommendation_store.get(user_id)
+        if stored is not None and stored.max_results >= max_results:
+            seen = self.seen_videos.get(user_id)
+            videos = [video for video in stored.videos if video['video_id'] not in seen]
+            if len(videos) >= max_results or len(videos) == len(stored.videos):
+                return [dict(video) for video in videos[:max_results]]
+        generate = max(max_results, stored.max_results if stored is not None else 0)
+        videos = self._compute_recommendations(user_id, generate)
+        self.recommendation_store.put(user_id, videos, generate)
+        return [dict(video) for video in videos[:max_results]]
+    
+    def recommendations_generated_at(self, user_id: int) -> Optional[datetime]:
+        """When the stored recommendations of a user were generated, if there are any"""
+        stored = self.recommendation_store.get(user_id)
+        return stored.generated_at if stored is not None else None
+    
+    def invalidate_recommendations(self, user_id: int) -> None:
+        """Drop a user's stored recommendations after their favorites or preferences changed.
+        
+        If the user had recommendations stored they are recomputed in the
+        background, so their next visit is still served from the store.
+        """
+        stored = self.recommendation_store.get(user_id)
+        self.recommendation_store.invalidate(user_id)
+        if stored is None:
+            return
+        with self._refresh_lock:
+            if user_id in self._refreshing:
+                # The running recompute may have read the old favorites; run it again
+                self._dirty.add(user_id)
+                return
+            self._refreshing.add(user_id)
+        self.refresh_executor.submit(contextvars.copy_context().run, self._refresh, user_id, stored.max_results)
+    
+    def _refresh(self, user_id: int, max_results: int) -> None:
+        try:
+            while True:
+                with self._refresh_lock:
+                    self._dirty.discard(user_id)
+                videos = self._compute_recommendations(user_id, max_results)
+                with self._refresh_lock:
+                    if user_id not in self._dirty:
+                        self.recommendation_store.put(user_id, videos, max_results)
+                        return
+        except Exception:
+            logger.exception("Recomputing recommendations for user %s failed", user_id)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(user_id)
+                self._dirty.discard(user_id)
+    
+    def _compute_recommendations(self, user_id: int, max_results: int) -> List[Dict[str, Any]]:
         # Obtener favoritos del usuario
         favorites = self.favorite_repo.get_by_user(user_id)
         if not favorites or len(favorites) == 0:
             return []
-        # Generar queries a partir de los títulos/canales de los favoritos
-        queries = []
-        for fav in favorites:
-            if fav.title:
-                queries.append(fav.title)
-            if fav.channel:
-                queries.append(fav.channel)
-        # Buscar videos usando los queries
-        recommendations = []
-        for query in queries[:3]:
-            try:
-                videos = self.youtube_service.search_videos(query, max_results=max_results//3)
-                recommendations.extend(videos)
-            except Exception:
-                continue
+        self.content_index.add_videos(self._favorite_to_video(fav) for fav in favorites)
+        
+        # Rankear candidatos locales contra el perfil de intereses del usuario
+        profile = self._build_profile(user_id, favorites)
+        # Filtrar antes de rankear lo que el usuario ya marcó como favorito o ya vio
+        exclude = self.seen_videos.get(user_id) | {fav.video_id for fav in favorites}
+        ranked = self.content_index.search(profile, max_results, exclude)
+        
+        recommendations = [video for video, _ in ranked]
+        if len(recommendations) < max_results:
+            # Pocos candidatos locales: recargar el índice desde YouTube y volver a rankear
+            queries = self._generate_recommendation_queries(self.preferences_repo.get_by_user(user_id), profile)
+            if not queries:
+                for fav in favorites:
+                    if fav.title:
+                        queries.append(fav.title)
+                    if fav.channel:
+                        queries.append(fav.channel)
+            fetched = self._search_concurrently(queries[:3], max_results // 3)
+            self.content_index.add_videos(fetched)
+            recommendations = [video for video, _ in self.content_index.search(profile, max_results, exclude)]
+            if not recommendations:
+                # Perfil sin términos útiles: usar el orden de búsqueda de YouTube
+                recommendations = [video for video in fetched if video['video_id'] not in exclude]
+        
         # Eliminar duplicados y limitar resultados
         seen_videos = set()
         unique_recommendations = []
@@ -58,95 +171,92 @@ class RecommendationsUseCase:
             if video['video_id'] not in seen_videos and len(unique_recommendations) < max_results:
                 seen_videos.add(video['video_id'])
                 unique_recommendations.append(video)
-        return unique_recommendations
+        return self._hydrate(unique_recommendations)
+    
+    def _build_profile(self, user_id: int, favorites: List[FavoriteVideo]) -> Dict[str, float]:
+        """The stored interest profile; users without one yet start from their favorites"""
+        try:
+            profile = self.interest_profiles.top_terms(user_id, PROFILE_MAX_TERMS)
+        except Exception as e:
+            logger.warning("Reading the interest profile of user %s failed: %s", user_id, e)
+            profile = {}
+        if profile:
+            return profile
+        terms: Counter = Counter()
+        for fav in favorites:
+            terms.update(video_terms(self._favorite_to_video(fav)))
+        return dict(terms.most_common(PROFILE_MAX_TERMS))
     
-    def update_preferences(self, user_id: int, genres: Optional[List[str]] = None,
-                          topics: Optional[List[str]] = None, languages: Optional[List[str]] = None,
-                          min_duration: Optional[int] = None, max_duration: Optional[int] = None) -> UserPreferences:
-        """Update user preferences"""
-        preferences = self.preferences_repo.get_by_user(user_id)
+    def _favorite_to_video(self, fav: FavoriteVideo) -> Dict[str, Any]:
+        return {
+            'video_id': fav.video_id,
+            'title': fav.title,
+            'description': fav.description or '',
+            'channel_title': fav.channel or '',
+            'tags': fav.tags or [],
+            'thumbnail': fav.thumbnail,
+            'url': fav.url,
+            'duration': fav.duration
+        }
+    
+    def _search_concurrently(self, queries: List[str], max_results: int) -> List[Dict[str, Any]]:
+        """Run the searches in parallel and keep whatever finished before the deadline.
+        
+        Results stay in query order. A slow search is left to finish in the
+        background (its response still lands in the cache) and a failed one is
+        skipped, so one bad query never holds up or breaks the response.
+        """
+        futures = [
+            self.search_executor.submit(contextvars.copy_context().run, self.youtube_service.search_videos, query, max_results)
+            for query in queries
+        ]
+        done, pending = wait(futures, timeout=self.deadline)
+        for future in pending:
+            future.cancel()
+        if pending:
+            logger.info("%d of %d recommendation searches missed the %.1fs deadline", len(pending), len(futures), self.deadline)
         
-        if preferences:
-            # Update existing preferences
-            if genres is not None:
-                preferences.genres = genres
-            if topics is not None:
-                preferences.topics = topics
-            if languages is not None:
-                preferences.languages = languages
-            if min_duration is not None:
-                preferences.min_duration = min_duration
-            if max_duration is not None:
-                preferences.max_duration = max_duration
-            
-            preferences.updated_at = datetime.now()
-            return self.preferences_repo.update(preferences)
-        else:
-            # Create new preferences
-            preferences = UserPreferences(
-                id=0,
-                user_id=user_id,
-                genres=genres or [],
-                topics=topics or [],
-                languages=languages or [],
-                min_duration=min_duration,
-                max_duration=max_duration
-            )
-            return self.preferences_repo.create(preferences)
+        recommendations = []
+        for future in futures:
+            if future in done and future.exception() is None:
+                recommendations.extend(future.result())
+        return recommendations
+    
+    def _hydrate(self, videos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Add statistics and duration to search results with one batched details lookup"""
+        missing = [video['video_id'] for video in videos if 'view_count' not in video]
+        if not missing:
+            return videos
+        try:
+            details = self.youtube_service.get_videos_details_batch(missing)
+        except Exception:
+            # Search results are still useful without statistics
+            return videos
+        return [{**video, **details.get(video['video_id'], {})} for video in videos]
     
     def get_view_history(self, user_id: int, days_back: int = 30) -> List[ViewHistory]:
         """Get user's viewing history for the last N days"""
-        history = self.history_repo.get_by_user(user_id)
         limit_date = datetime.now() - timedelta(days=days_back)
-        
-        return [h for h in history if h.viewed_at >= limit_date]
+        return self.history_repo.get_by_user_in_range(user_id, since=limit_date)
     
     def remove_from_history(self, history_id: int) -> bool:
         """Remove a video from viewing history"""
         return self.history_repo.delete(history_id)
     
-    def _generate_recommendation_queries(self, preferences: UserPreferences, history: List[ViewHistory]) -> List[str]:
-        """Generate search queries based on user preferences and viewing history"""
+    def _generate_recommendation_queries(self, preferences: Optional[UserPreferences],
+                                         profile: Dict[str, float]) -> List[str]:
+        """Generate search queries from the user's preferences and strongest interest terms"""
         queries = []
         
         # Add queries based on user preferences
-        if preferences.topics:
+        if preferences and preferences.topics:
             queries.extend(preferences.topics[:3])  # Top 3 topics
         
-        if preferences.genres:
+        if preferences and preferences.genres:
             queries.extend(preferences.genres[:2])  # Top 2 genres
         
-        # Add queries based on recent viewing history
-        if history:
-            # Get most viewed videos in the last week
-            one_week_ago = datetime.now() - timedelta(days=7)
-            recent_videos = [h for h in history if h.viewed_at >= one_week_ago]
-            
-            if recent_videos:
-                # Extract keywords from recent video titles
-                titles = [h.title for h in recent_videos]
-                keywords = self._extract_keywords(titles)
-                queries.extend(keywords[:2])  # Top 2 keywords
-        
-        # Add some general popular topics if we don't have enough queries
-        if len(queries) < 3:
-            queries.extend(['music', 'technology', 'gaming'])
+        # Add the strongest terms of the interest profile
+        top_terms = sorted(profile, key=profile.get, reverse=True)
+        queries.extend(term for term in top_terms[:5] if term not in queries)
         
         return queries[:5]  # Return top 5 queries
-    
-    def _extract_keywords(self, titles: List[str]) -> List[str]:
-        """Extract keywords from video titles"""
-        # Simple keyword extraction - in a real implementation, you might use NLP
-        common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        
-        all_words = []
-        for title in titles:
-            words = title.lower().split()
-            filtered_words = [w for w in words if w not in common_words and len(w) > 2]
-            all_words.extend(filtered_words)
-        
-        # Count word frequency
-        from collections import Counter
-        counter = Counter(all_words)
-        
-        return [word for word, _ in counter.most_common(5)] 
\ No newline at end of file
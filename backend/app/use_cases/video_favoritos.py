@@ -56,6 +56,38 @@ class FavoriteVideosUseCase:
         
         return self.video_repo.update(video)
     
+    def refresh_favorites_metadata(self, user_id: int) -> List[FavoriteVideo]:
+        """Refresh title, channel, thumbnail and duration of a user's favorites from YouTube.
+        
+        Details are fetched with batched lookups and only favorites whose
+        metadata actually changed are written back. Returns the updated ones.
+        """
+        favorites = self.video_repo.get_by_user(user_id)
+        if not favorites:
+            return []
+        
+        details = self.youtube_service.get_videos_details_batch([video.video_id for video in favorites])
+        
+        changed = []
+        for video in favorites:
+            video_details = details.get(video.video_id)
+            if not video_details:
+                continue
+            refreshed = {
+                'title': video_details['title'],
+                'description': video_details['description'],
+                'thumbnail': video_details['thumbnail'],
+                'channel': video_details['channel_title'],
+                'duration': video_details['duration']
+            }
+            if any(getattr(video, field) != value for field, value in refreshed.items()):
+                for field, value in refreshed.items():
+                    setattr(video, field, value)
+                changed.append(video)
+        
+        self.video_repo.update_many(changed)
+        return changed
+    
     def remove_favorite_video(self, video_id: int) -> bool:
         """Remove a video from favorites"""
         return self.video_repo.delete(video_id)
@@ -0,0 +1,96 @@
+import pytest
+
+from app.infrastructure import circuit_breaker
+from app.infrastructure.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', fake)
+    return fake
+
+
+def _open(breaker):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker('search', failure_threshold=3, reset_timeout=30)
+
+    _open(breaker)
+
+    assert breaker.is_open()
+    assert not breaker.allow()
+    assert breaker.stats()['opened'] == 1
+    assert breaker.stats()['rejected'] == 1
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker('search', failure_threshold=3)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.allow()
+    assert breaker.stats()['consecutive_failures'] == 1
+
+
+def test_half_open_lets_a_single_trial_through(clock):
+    breaker = CircuitBreaker('search', failure_threshold=1, reset_timeout=30)
+    _open(breaker)
+
+    clock.now += 30
+
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert breaker.stats()['state'] == 'half_open'
+
+
+def test_successful_trial_closes_the_circuit(clock):
+    breaker = CircuitBreaker('search', failure_threshold=1, reset_timeout=30)
+    _open(breaker)
+    clock.now += 30
+
+    assert breaker.allow()
+    breaker.record_success()
+
+    assert breaker.stats()['state'] == 'closed'
+    assert breaker.allow()
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens_the_circuit(clock):
+    breaker = CircuitBreaker('search', failure_threshold=5, reset_timeout=30)
+    _open(breaker)
+    clock.now += 30
+
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.is_open()
+    assert not breaker.allow()
+    assert breaker.stats()['opened'] == 2
+
+
+def test_released_trial_can_be_taken_again(clock):
+    breaker = CircuitBreaker('search', failure_threshold=1, reset_timeout=30)
+    _open(breaker)
+    clock.now += 30
+
+    assert breaker.allow()
+    breaker.release()
+
+    assert breaker.allow()
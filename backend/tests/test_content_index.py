@@ -0,0 +1,79 @@
+from app.domain.terms import tokenize, video_terms
+from app.infrastructure.content_index import ContentIndex
+
+
+def _video(video_id, title, tags=(), channel='', description=''):
+    return {'video_id': video_id, 'title': title, 'tags': list(tags), 'channel_title': channel,
+            'description': description}
+
+
+def test_tokenize_drops_stop_words_numbers_and_short_words():
+    assert tokenize("The 10 BEST Python tips for a new dev, con Flask y mas!") == [
+        'best', 'python', 'tips', 'dev', 'flask'
+    ]
+    assert tokenize(None) == []
+
+
+def test_video_terms_weights_fields():
+    terms = video_terms(_video('a', 'Python', tags=['python'], channel='Coder', description='python'))
+
+    assert terms == {'python': 6.0, 'coder': 2.0}
+
+
+def test_search_ranks_by_similarity_to_profile():
+    index = ContentIndex()
+    index.add_videos([
+        _video('py', 'Python tutorial', tags=['python', 'programming']),
+        _video('cook', 'Pasta recipe', tags=['cooking']),
+        _video('mixed', 'Cooking with Python', tags=['cooking'])
+    ])
+
+    ranked = index.search({'python': 1.0, 'programming': 0.5}, limit=5)
+
+    assert [video['video_id'] for video, _ in ranked] == ['py', 'mixed']
+    assert ranked[0][1] > ranked[1][1]
+
+
+def test_rare_terms_outweigh_common_ones():
+    index = ContentIndex()
+    index.add_videos([_video(f'music{i}', 'music') for i in range(5)] + [_video('jazz', 'jazz music')])
+
+    ranked = index.search({'music': 1.0, 'jazz': 1.0}, limit=1)
+
+    assert ranked[0][0]['video_id'] == 'jazz'
+
+
+def test_excluded_videos_are_filtered_before_the_limit():
+    index = ContentIndex()
+    index.add_videos([_video('a', 'python python'), _video('b', 'python')])
+
+    ranked = index.search({'python': 1.0}, limit=1, exclude={'a'})
+
+    assert [video['video_id'] for video, _ in ranked] == ['b']
+
+
+def test_reindexing_replaces_the_previous_terms():
+    index = ContentIndex()
+    index.add_videos([_video('a', 'python')])
+    index.add_videos([_video('a', 'cooking')])
+
+    assert index.search({'python': 1.0}, limit=5) == []
+    assert index.stats() == {'documents': 1, 'terms': 1}
+
+
+def test_oldest_videos_are_evicted_past_max_documents():
+    index = ContentIndex(max_documents=2)
+    index.add_videos([_video('a', 'python'), _video('b', 'python'), _video('c', 'python')])
+
+    assert {video['video_id'] for video, _ in index.search({'python': 1.0}, limit=5)} == {'b', 'c'}
+
+
+def test_results_are_copies_with_trimmed_descriptions():
+    index = ContentIndex(max_description_chars=5)
+    index.add_videos([_video('a', 'python', description='python ' * 20)])
+
+    video, _ = index.search({'python': 1.0}, limit=1)[0]
+    video['title'] = 'changed'
+
+    assert len(video['description']) == 5
+    assert index.search({'python': 1.0}, limit=1)[0][0]['title'] == 'python'
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+
+from app.infrastructure.pagination import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError, clamp_page_size, decode_cursor,
+    decode_datetime_cursor, encode_cursor, split_page
+)
+
+
+def test_cursor_round_trips_datetime_and_id():
+    added_at = datetime(2024, 5, 1, 12, 30, 15)
+    token = encode_cursor(added_at, 42)
+
+    assert '=' not in token
+    assert decode_datetime_cursor(token) == (added_at, 42)
+
+
+def test_cursor_round_trips_plain_values():
+    assert decode_cursor(encode_cursor('Ana', 7)) == ('Ana', 7)
+
+
+@pytest.mark.parametrize('token', ['', 'not-base64!', 'WzEsMiwzXQ', 'eyJhIjoxfQ'])
+def test_malformed_cursor_is_rejected(token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_datetime_cursor_rejects_non_timestamp_sort_value():
+    with pytest.raises(InvalidCursorError):
+        decode_datetime_cursor(encode_cursor('Ana', 7))
+
+
+@pytest.mark.parametrize('limit, expected', [
+    (None, DEFAULT_PAGE_SIZE),
+    (0, 1),
+    (-5, 1),
+    (10, 10),
+    (MAX_PAGE_SIZE + 1, MAX_PAGE_SIZE)
+])
+def test_clamp_page_size(limit, expected):
+    assert clamp_page_size(limit) == expected
+
+
+def test_split_page_without_look_ahead_row_is_last_page():
+    rows = [{'id': 1, 'added_at': datetime(2024, 1, 1)}]
+
+    assert split_page(rows, 2, 'added_at') == (rows, None)
+
+
+def test_split_page_trims_look_ahead_row_and_points_at_last_kept_row():
+    rows = [{'id': i, 'added_at': datetime(2024, 1, 10 - i)} for i in range(1, 4)]
+
+    page, next_cursor = split_page(rows, 2, 'added_at')
+
+    assert page == rows[:2]
+    assert decode_datetime_cursor(next_cursor) == (rows[1]['added_at'], 2)
@@ -0,0 +1,114 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.domain.models import FavoriteVideo, ViewHistory
+from app.use_cases.perfil_intereses import (
+    COMPLETED_VIEW_WEIGHT, FAVORITE_WEIGHT, PREFERENCE_WEIGHT, VIEW_WEIGHT, WEIGHT_EPOCH, InterestProfileUseCase
+)
+
+
+class FakeInterestRepository:
+    def __init__(self):
+        self.weights = defaultdict(float)
+        self.pruned = []
+        self.fail = False
+
+    def add_weights(self, increments):
+        if self.fail:
+            raise Exception("database unavailable")
+        for key, weight in increments.items():
+            self.weights[key] += weight
+
+    def get_top_terms(self, user_id, limit):
+        terms = [(term, weight) for (uid, term), weight in self.weights.items() if uid == user_id]
+        return sorted(terms, key=lambda item: item[1], reverse=True)[:limit]
+
+    def prune(self, user_id, keep):
+        self.pruned.append((user_id, keep))
+
+
+def _view(title, viewed_at, completed=False, user_id=1):
+    return ViewHistory(id=0, user_id=user_id, video_id='v', title=title, viewed_at=viewed_at, view_duration=60,
+                       completed=completed)
+
+
+@pytest.fixture
+def repository():
+    return FakeInterestRepository()
+
+
+@pytest.fixture
+def profiles(repository):
+    return InterestProfileUseCase(repository, half_life_days=14, max_stored_terms=200)
+
+
+def test_scale_is_one_at_the_epoch_and_doubles_every_half_life(profiles):
+    assert profiles._scale(WEIGHT_EPOCH) == pytest.approx(1.0)
+    assert profiles._scale(WEIGHT_EPOCH + timedelta(days=14)) == pytest.approx(2.0)
+    assert profiles._scale(WEIGHT_EPOCH + timedelta(days=42)) == pytest.approx(8.0)
+
+
+def test_scale_ratio_depends_only_on_elapsed_time(profiles):
+    earlier = datetime(2025, 3, 1)
+    later = earlier + timedelta(days=7)
+
+    assert profiles._scale(later) / profiles._scale(earlier) == pytest.approx(2 ** 0.5)
+
+
+def test_top_terms_are_decayed_to_now(profiles):
+    now = datetime.now()
+    profiles.record_views([
+        _view('python', now, completed=True),
+        _view('cooking', now - timedelta(days=14), completed=True)
+    ])
+
+    terms = profiles.top_terms(1)
+
+    assert list(terms) == ['python', 'cooking']
+    assert terms['python'] == pytest.approx(COMPLETED_VIEW_WEIGHT, rel=1e-3)
+    assert terms['cooking'] == pytest.approx(COMPLETED_VIEW_WEIGHT / 2, rel=1e-3)
+
+
+def test_signals_add_their_weights(profiles):
+    now = datetime.now()
+    profiles.record_views([_view('python', now)])
+    profiles.record_favorites([FavoriteVideo(id=1, user_id=1, video_id='f', title='python', description='',
+                                             url='', thumbnail='', channel='', duration='', published_at=None)])
+    profiles.record_preferences(1, topics=['python'])
+
+    # Favorites count the title field weight (3.0) of video_terms
+    expected = VIEW_WEIGHT + FAVORITE_WEIGHT * 3.0 + PREFERENCE_WEIGHT
+    assert profiles.top_terms(1)['python'] == pytest.approx(expected, rel=1e-3)
+
+
+def test_future_view_times_are_clamped_to_now(profiles):
+    profiles.record_views([_view('python', datetime(2037, 1, 1), completed=True)])
+
+    assert profiles.top_terms(1)['python'] == pytest.approx(COMPLETED_VIEW_WEIGHT, rel=1e-3)
+
+
+def test_terms_longer_than_the_column_are_skipped(profiles, repository):
+    profiles.record_preferences(1, topics=['x' * 65, 'python'])
+
+    assert [term for _, term in repository.weights] == ['python']
+
+
+def test_profiles_are_pruned_after_a_fixed_number_of_term_updates(repository):
+    profiles = InterestProfileUseCase(repository, half_life_days=14, max_stored_terms=8)
+
+    profiles.record_preferences(1, topics=['alpha'])
+    assert repository.pruned == []
+    profiles.record_preferences(1, topics=['beta'])
+    assert repository.pruned == [(1, 8)]
+    profiles.record_preferences(1, topics=['gamma'])
+    assert repository.pruned == [(1, 8)]
+
+
+def test_repository_errors_do_not_propagate(profiles, repository):
+    repository.fail = True
+
+    profiles.record_preferences(1, topics=['python'])
+
+    assert repository.weights == {}
@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from app.infrastructure.seen_videos import SeenVideosCache
+
+
+def _cache(loader, ttl=60):
+    return SeenVideosCache(loader, ttl=ttl, max_users=100, max_bytes=1024 * 1024)
+
+
+def test_set_is_loaded_once_and_served_from_memory():
+    loads = []
+
+    def loader(user_id):
+        loads.append(user_id)
+        return {'a', 'b'}
+
+    cache = _cache(loader)
+
+    assert cache.get(1) == {'a', 'b'}
+    assert cache.get(1) == {'a', 'b'}
+    assert loads == [1]
+
+
+def test_added_videos_update_a_cached_set():
+    cache = _cache(lambda user_id: {'a'})
+    cache.get(1)
+
+    cache.add(1, ['b'])
+
+    assert cache.get(1) == {'a', 'b'}
+
+
+def test_adds_for_uncached_users_are_left_to_the_next_load():
+    loads = []
+    cache = _cache(lambda user_id: loads.append(user_id) or {'a'})
+
+    cache.add(1, ['b'])
+
+    assert loads == []
+    assert cache.get(1) == {'a'}
+
+
+def test_views_added_during_a_load_are_merged_into_it():
+    started = threading.Event()
+    release = threading.Event()
+
+    def loader(user_id):
+        started.set()
+        release.wait(5)
+        return {'a'}
+
+    cache = _cache(loader)
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(seen=cache.get(1)))
+    thread.start()
+    assert started.wait(5)
+
+    cache.add(1, ['b'])
+    release.set()
+    thread.join(5)
+
+    assert result['seen'] == {'a', 'b'}
+    assert cache.get(1) == {'a', 'b'}
+
+
+def test_failed_load_is_not_cached():
+    calls = []
+
+    def loader(user_id):
+        calls.append(user_id)
+        if len(calls) == 1:
+            raise Exception("database unavailable")
+        return {'a'}
+
+    cache = _cache(loader)
+
+    with pytest.raises(Exception):
+        cache.get(1)
+    assert cache.get(1) == {'a'}
+
+
+def test_invalidate_forces_a_reload():
+    loads = []
+    cache = _cache(lambda user_id: loads.append(user_id) or {'a'})
+    cache.get(1)
+
+    cache.invalidate(1)
+    cache.get(1)
+
+    assert loads == [1, 1]
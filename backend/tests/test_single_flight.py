@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from app.infrastructure.single_flight import SingleFlight
+
+
+def _run_concurrently(flight, key, fn, callers):
+    results = []
+    errors = []
+
+    def call():
+        try:
+            results.append(flight.do(key, fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for callers"
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return 'result'
+
+    threads, results, errors = _run_concurrently(flight, 'k', fn, 5)
+    _wait_for(lambda: flight.stats()['coalesced'] == 4)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ['result'] * 5
+    assert errors == []
+    assert flight.stats() == {'leaders': 1, 'coalesced': 4, 'in_flight': 0}
+
+
+def test_waiters_receive_the_leaders_exception():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def fn():
+        release.wait(5)
+        raise ValueError('upstream failed')
+
+    threads, results, errors = _run_concurrently(flight, 'k', fn, 3)
+    _wait_for(lambda: flight.stats()['coalesced'] == 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == []
+    assert len(errors) == 3
+    assert all(isinstance(error, ValueError) for error in errors)
+
+
+def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    counter = iter(range(10))
+
+    assert flight.do('k', lambda: next(counter)) == 0
+    assert flight.do('k', lambda: next(counter)) == 1
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+
+    assert flight.do('a', lambda: 'a') == 'a'
+    assert flight.do('b', lambda: 'b') == 'b'
+    assert flight.stats()['leaders'] == 2
+
+
+def test_failed_call_is_not_remembered():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        flight.do('k', fail)
+    assert flight.do('k', lambda: 'ok') == 'ok'
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+import pymysql
+
+from app.domain.models import ViewHistory
+from app.infrastructure.view_event_writer import ViewEventWriter
+
+
+class FakeViewHistoryRepository:
+    """Rejects any batch containing a view of a user listed in bad_users; the first
+    `outages` calls fail as if the connection was lost"""
+
+    def __init__(self, bad_users=(), outages=0):
+        self.bad_users = set(bad_users)
+        self.outages = outages
+        self.calls = 0
+        self.stored = []
+
+    def create_many(self, histories):
+        self.calls += 1
+        if self.calls <= self.outages:
+            cause = pymysql.err.OperationalError(2013, "Lost connection to MySQL server during query")
+            raise Exception(f"Error creating view history batch: {cause}") from cause
+        if any(history.user_id in self.bad_users for history in histories):
+            cause = pymysql.err.IntegrityError(1452, "Cannot add or update a child row: a foreign key constraint fails")
+            raise Exception(f"Error creating view history batch: {cause}") from cause
+        self.stored.extend(histories)
+        return len(histories)
+
+
+def _view(user_id):
+    return ViewHistory(id=0, user_id=user_id, video_id=f"v{user_id}", title='', viewed_at=datetime.now(),
+                       view_duration=10)
+
+
+def test_failed_batch_only_drops_rejected_rows():
+    repository = FakeViewHistoryRepository(bad_users={3, 6})
+    written = []
+    writer = ViewEventWriter(repository, batch_size=10, flush_interval=60, retry_backoff=0,
+                             on_written=written.extend)
+
+    writer._flush([_view(user_id) for user_id in range(1, 8)])
+
+    assert [history.user_id for history in repository.stored] == [1, 2, 4, 5, 7]
+    assert written == repository.stored
+    stats = writer.stats()
+    assert stats['written'] == 5
+    assert stats['failed'] == 2
+
+
+def test_listener_not_called_when_nothing_was_stored():
+    calls = []
+    writer = ViewEventWriter(FakeViewHistoryRepository(bad_users={1}), retry_backoff=0, on_written=calls.append)
+
+    writer._flush([_view(1)])
+
+    assert calls == []
+    assert writer.stats()['failed'] == 1
+
+
+def test_connection_errors_retry_the_whole_batch_without_dropping_events():
+    repository = FakeViewHistoryRepository(outages=2)
+    writer = ViewEventWriter(repository, retry_attempts=5, retry_backoff=0)
+
+    writer._flush([_view(user_id) for user_id in range(1, 9)])
+
+    assert [history.user_id for history in repository.stored] == list(range(1, 9))
+    assert repository.calls == 3
+    stats = writer.stats()
+    assert stats['failed'] == 0
+    assert stats['written'] == 8
+    assert stats['retries'] == 2
+
+
+def test_persistent_outage_is_not_bisected():
+    repository = FakeViewHistoryRepository(outages=100)
+    writer = ViewEventWriter(repository, retry_attempts=3, retry_backoff=0)
+
+    writer._flush([_view(user_id) for user_id in range(1, 9)])
+
+    assert repository.calls == 4
+    assert writer.stats()['failed'] == 8
+
+
+def test_close_flushes_queued_events():
+    repository = FakeViewHistoryRepository()
+    writer = ViewEventWriter(repository, batch_size=100, flush_interval=60)
+
+    writer.submit(_view(1))
+    writer.submit(_view(2))
+    writer.close()
+
+    assert [history.user_id for history in repository.stored] == [1, 2]
@@ -0,0 +1,71 @@
+import time
+
+from app.infrastructure.youtube_cache import CacheEntry, LRUResponseCache, cache_key
+
+
+def _entry(value, ttl=60, size=10):
+    return CacheEntry(value=value, expires_at=time.time() + ttl, size=size)
+
+
+def test_get_returns_fresh_entry_and_counts_hit():
+    cache = LRUResponseCache()
+    cache.set('k', _entry('v'))
+
+    assert cache.get('k').value == 'v'
+    assert cache.stats()['hits'] == 1
+
+
+def test_expired_entry_is_a_miss_unless_stale_is_allowed():
+    cache = LRUResponseCache(stale_ttl=60)
+    cache.set('k', _entry('v', ttl=-1))
+
+    assert cache.get('k') is None
+    assert cache.get('k', allow_stale=True).value == 'v'
+    assert cache.stats()['stale_hits'] == 1
+
+
+def test_entry_past_stale_window_is_removed():
+    cache = LRUResponseCache(stale_ttl=0)
+    cache.set('k', _entry('v', ttl=-1))
+
+    assert cache.get('k', allow_stale=True) is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_least_recently_used_entry_is_evicted_by_count():
+    cache = LRUResponseCache(max_entries=2)
+    cache.set('a', _entry(1))
+    cache.set('b', _entry(2))
+    cache.get('a')
+    cache.set('c', _entry(3))
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.stats()['evictions'] == 1
+
+
+def test_entries_are_evicted_to_stay_under_byte_cap():
+    cache = LRUResponseCache(max_bytes=25)
+    cache.set('a', _entry(1, size=10))
+    cache.set('b', _entry(2, size=10))
+    cache.set('c', _entry(3, size=10))
+
+    assert cache.get('a') is None
+    assert cache.stats()['bytes'] == 20
+
+
+def test_oversized_replacement_drops_previous_value():
+    cache = LRUResponseCache(max_bytes=100)
+    cache.set('k', _entry('old', size=10))
+    cache.set('k', _entry('new', size=1000))
+
+    assert cache.get('k') is None
+    assert cache.stats()['bytes'] == 0
+
+
+def test_cache_key_ignores_api_key_none_values_and_query_formatting():
+    first = cache_key('search', {'q': '  Lo-Fi   Beats ', 'key': 'secret', 'maxResults': 10, 'pageToken': None})
+    second = cache_key('search', {'maxResults': 10, 'q': 'lo-fi beats', 'key': 'other'})
+
+    assert first == second
+    assert 'secret' not in first
@@ -0,0 +1,137 @@
+from collections import defaultdict
+
+import pytest
+
+from app.infrastructure.youtube_quota import (
+    MODE_CACHE_ONLY, MODE_DEGRADED, MODE_NORMAL, QuotaExhaustedError, QuotaLedger, quota_user
+)
+
+
+class FakeQuotaRepository:
+    """In-memory youtube_quota_usage table; fail_add/fail_get make the next call raise"""
+
+    def __init__(self):
+        self.rows = defaultdict(int)
+        self.add_calls = 0
+        self.fail_add = False
+        self.fail_get = False
+
+    def add_usage(self, usage):
+        self.add_calls += 1
+        if self.fail_add:
+            self.fail_add = False
+            raise Exception("database unavailable")
+        for key, units in usage.items():
+            self.rows[key] += units
+
+    def get_usage(self, quota_date):
+        if self.fail_get:
+            self.fail_get = False
+            raise Exception("database unavailable")
+        return [
+            {'endpoint': endpoint, 'user_id': user_id, 'units': units}
+            for (day, endpoint, user_id), units in self.rows.items() if day == quota_date
+        ]
+
+    def total(self):
+        return sum(self.rows.values())
+
+
+def _ledger(repository=None, daily_limit=1000):
+    return QuotaLedger(repository, daily_limit=daily_limit, degraded_ratio=0.8, cache_only_ratio=0.95,
+                       sync_interval=0)
+
+
+def test_calls_are_charged_their_documented_cost():
+    ledger = _ledger()
+
+    ledger.spend('search')
+    ledger.spend('video')
+
+    stats = ledger.stats()
+    assert stats['used'] == 101
+    assert stats['by_endpoint'] == {'search': 100, 'video': 1}
+    assert ledger.mode() == MODE_NORMAL
+
+
+def test_spend_is_attributed_to_the_current_user():
+    ledger = _ledger()
+    token = quota_user.set(7)
+    try:
+        ledger.spend('search')
+    finally:
+        quota_user.reset(token)
+    ledger.spend('video')
+
+    assert ledger.user_usage(7) == {'search': 100}
+    assert ledger.stats()['top_users'] == [{'user_id': 7, 'units': 100}]
+
+
+def test_degraded_mode_only_blocks_expensive_calls():
+    ledger = _ledger(daily_limit=1000)
+    for _ in range(8):
+        ledger.spend('search')
+
+    assert ledger.mode() == MODE_DEGRADED
+    with pytest.raises(QuotaExhaustedError):
+        ledger.spend('search')
+    ledger.spend('video')
+
+
+def test_cache_only_mode_blocks_every_call():
+    ledger = _ledger(daily_limit=100)
+    for _ in range(95):
+        ledger.spend('video')
+
+    assert ledger.mode() == MODE_CACHE_ONLY
+    with pytest.raises(QuotaExhaustedError):
+        ledger.spend('video')
+
+
+def test_mark_exhausted_switches_to_cache_only():
+    ledger = _ledger()
+
+    ledger.mark_exhausted()
+
+    assert ledger.mode() == MODE_CACHE_ONLY
+    with pytest.raises(QuotaExhaustedError):
+        ledger.spend('video')
+
+
+def test_spend_is_synced_and_other_workers_spend_is_read_back():
+    repository = FakeQuotaRepository()
+    worker_a = _ledger(repository)
+    worker_b = _ledger(repository)
+
+    worker_a.spend('search')
+    worker_a.spend('video')  # syncs the search charged above before charging
+    worker_b.spend('video')  # reads worker A's stored search before charging
+
+    assert repository.total() == 100
+    assert worker_b.stats()['used'] == 101
+
+
+def test_units_are_retried_when_the_write_fails():
+    repository = FakeQuotaRepository()
+    ledger = _ledger(repository)
+    ledger.spend('search')
+
+    repository.fail_add = True
+    ledger.spend('video')
+    ledger.spend('video')
+
+    assert repository.total() == 101
+
+
+def test_failed_refresh_does_not_write_units_twice():
+    repository = FakeQuotaRepository()
+    ledger = _ledger(repository)
+    ledger.spend('search')
+
+    repository.fail_get = True
+    ledger.spend('video')  # stores the search, then the refresh fails
+    ledger.spend('video')  # stores the first video
+    ledger.spend('video')
+
+    assert repository.total() == 102
+    assert ledger.stats()['used'] == 103
@@ -0,0 +1,21 @@
+from app.config import Config
+from app.infrastructure.youtube_api import create_youtube_session
+
+
+def _retry_policy(max_retry_after):
+    config = Config()
+    config.YOUTUBE_MAX_RETRY_AFTER = max_retry_after
+    return create_youtube_session(config).get_adapter('https://www.googleapis.com').max_retries
+
+
+def test_retry_after_cap_comes_from_config():
+    assert _retry_policy(1).max_retry_after == 1
+
+
+def test_retry_after_cap_survives_increment():
+    retry = _retry_policy(1)
+
+    retried = retry.increment(method='GET', url='/youtube/v3/search')
+
+    assert retried.max_retry_after == 1
+    assert retried.total == retry.total - 1
@@ -0,0 +1,65 @@
+import pytest
+from flask import Flask
+
+from app import routes
+from app.config import Config
+from app.infrastructure.youtube_api import PAGE_SIZE
+
+
+class FakeYouTubeService:
+    """Endless search and chart listings that count the pages requested from YouTube"""
+
+    def __init__(self, *args, **kwargs):
+        self.pages = 0
+
+    def iter_search_videos(self, query, region_code="US"):
+        return self._listing()
+
+    def iter_trending_videos(self, region_code="US", category_id=None, rich=False):
+        return self._listing()
+
+    def _listing(self):
+        index = 0
+        while True:
+            if index % PAGE_SIZE == 0:
+                self.pages += 1
+            yield {"id": f"video-{index}"}
+            index += 1
+
+
+@pytest.fixture
+def client_and_service(monkeypatch):
+    services = []
+
+    def build(*args, **kwargs):
+        services.append(FakeYouTubeService())
+        return services[-1]
+
+    monkeypatch.setattr(routes, "YouTubeAPIService", build)
+    app = Flask(__name__)
+    routes.register_routes(app)
+    return app.test_client(), services[0]
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/youtube/search?q=music&max_results=100000",
+    "/api/v1/youtube/trending?region=AR&max_results=100000",
+])
+def test_public_listings_cap_max_results(client_and_service, path):
+    client, service = client_and_service
+
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert len(response.get_json()["videos"]) == Config.YOUTUBE_MAX_RESULTS
+    assert service.pages == -(-Config.YOUTUBE_MAX_RESULTS // PAGE_SIZE)
+
+
+
+def test_trends_reject_non_numeric_category(client_and_service):
+    client, service = client_and_service
+
+    response = client.get("/api/trends?user_id=1&category=music")
+
+    assert response.status_code == 400
+    assert service.pages == 0
@@ -14,6 +14,7 @@ CREATE TABLE IF NOT EXISTS users (
     is_active BOOLEAN DEFAULT TRUE,
     email_verified BOOLEAN DEFAULT FALSE,
     INDEX idx_email (email),
+    INDEX idx_name_id (name, id),
     INDEX idx_is_active (is_active)
 );
 
@@ -37,6 +38,7 @@ CREATE TABLE IF NOT EXISTS favorite_videos (
     INDEX idx_user_id (user_id),
     INDEX idx_video_id (video_id),
     INDEX idx_added_at (added_at),
+    INDEX idx_user_added_at (user_id, added_at),
     INDEX idx_channel (channel)
 );
 
@@ -49,11 +51,14 @@ CREATE TABLE IF NOT EXISTS trend_analysis (
     analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     results JSON NOT NULL,
     criteria JSON,
+    statistics JSON,
+    total_videos INT,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     INDEX idx_user_id (user_id),
     INDEX idx_category (category),
     INDEX idx_region (region),
-    INDEX idx_analyzed_at (analyzed_at)
+    INDEX idx_analyzed_at (analyzed_at),
+    INDEX idx_user_analyzed_at (user_id, analyzed_at)
 );
 
 -- Tabla de historial de vistas
@@ -69,6 +74,8 @@ CREATE TABLE IF NOT EXISTS view_history (
     INDEX idx_user_id (user_id),
     INDEX idx_video_id (video_id),
     INDEX idx_viewed_at (viewed_at),
+    INDEX idx_user_viewed_at (user_id, viewed_at),
+    INDEX idx_user_video (user_id, video_id),
     INDEX idx_completed (completed)
 );
 
@@ -95,14 +102,20 @@ CREATE TABLE IF NOT EXISTS trending_videos_cache (
     description TEXT,
     thumbnail_url VARCHAR(500),
     channel_title VARCHAR(255) NOT NULL,
-    published_at TIMESTAMP,
+    channel_id VARCHAR(50),
+    published_at TIMESTAMP NULL,
+    duration VARCHAR(20),
     view_count BIGINT,
     like_count INT,
     comment_count INT,
-    category_id INT,
+    tags JSON,
+    category_id INT NOT NULL DEFAULT 0,
     region_code VARCHAR(10) NOT NULL,
+    rank_position INT NOT NULL DEFAULT 0,
+    fetched_at DATETIME(6) NOT NULL,
     cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE KEY unique_video_region (video_id, region_code),
+    UNIQUE KEY unique_video_region_category (video_id, region_code, category_id),
+    INDEX idx_region_category_rank (region_code, category_id, rank_position),
     INDEX idx_region_code (region_code),
     INDEX idx_category_id (category_id),
     INDEX idx_cached_at (cached_at),
@@ -118,6 +131,27 @@ CREATE TABLE IF NOT EXISTS video_categories (
     INDEX idx_name (name)
 );
 
+-- Consumo diario de cuota de la API de YouTube (día de cuota en hora del Pacífico)
+CREATE TABLE IF NOT EXISTS youtube_quota_usage (
+    quota_date DATE NOT NULL,
+    endpoint VARCHAR(32) NOT NULL,
+    user_id INT NOT NULL DEFAULT 0,
+    units BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (quota_date, endpoint, user_id)
+);
+
+-- Perfil de intereses por usuario (pesos con decaimiento temporal, escalados a una época fija)
+CREATE TABLE IF NOT EXISTS user_interest_terms (
+    user_id INT NOT NULL,
+    term VARCHAR(64) NOT NULL,
+    weight DOUBLE NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, term),
+    INDEX idx_user_weight (user_id, weight),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
 -- Usuario de prueba (hash bcrypt para 'test1234')
 INSERT IGNORE INTO users (name, email, password_hash, is_active, email_verified) 
 VALUES ('Usuario Prueba', 'prueba@example.com', '$2b$12$w8QwQwQwQwQwQwQwQwQwQeQwQwQwQwQwQwQwQwQwQwQwQwQwQwQw', TRUE, FALSE);
@@ -0,0 +1,14 @@
+-- Summary columns for trend_analysis listings
+-- Listings read statistics/total_videos from their own columns instead of parsing the results blob.
+-- Apply once on databases created before these columns were added to init.sql.
+
+USE castor_db;
+
+ALTER TABLE trend_analysis
+    ADD COLUMN statistics JSON AFTER criteria,
+    ADD COLUMN total_videos INT AFTER statistics;
+
+UPDATE trend_analysis
+SET statistics = JSON_EXTRACT(results, '$.statistics'),
+    total_videos = JSON_EXTRACT(results, '$.total_videos')
+WHERE statistics IS NULL;
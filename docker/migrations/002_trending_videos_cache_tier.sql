@@ -0,0 +1,18 @@
+-- Shared trending cache tier
+-- trending_videos_cache now holds one ranked chart per (region, category); category 0 is the unfiltered chart.
+-- Apply once on databases created before these columns were added to init.sql.
+
+USE castor_db;
+
+DELETE FROM trending_videos_cache;
+
+ALTER TABLE trending_videos_cache
+    ADD COLUMN channel_id VARCHAR(50) AFTER channel_title,
+    ADD COLUMN duration VARCHAR(20) AFTER published_at,
+    ADD COLUMN tags JSON AFTER comment_count,
+    ADD COLUMN rank_position INT NOT NULL DEFAULT 0 AFTER region_code,
+    MODIFY COLUMN published_at TIMESTAMP NULL,
+    MODIFY COLUMN category_id INT NOT NULL DEFAULT 0,
+    DROP INDEX unique_video_region,
+    ADD UNIQUE KEY unique_video_region_category (video_id, region_code, category_id),
+    ADD INDEX idx_region_category_rank (region_code, category_id, rank_position);
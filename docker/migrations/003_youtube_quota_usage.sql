@@ -0,0 +1,14 @@
+-- YouTube quota ledger
+-- Running totals of quota units per quota day (Pacific Time), endpoint and user (0 = no user).
+-- Apply once on databases created before this table was added to init.sql.
+
+USE castor_db;
+
+CREATE TABLE IF NOT EXISTS youtube_quota_usage (
+    quota_date DATE NOT NULL,
+    endpoint VARCHAR(32) NOT NULL,
+    user_id INT NOT NULL DEFAULT 0,
+    units BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (quota_date, endpoint, user_id)
+);
@@ -0,0 +1,15 @@
+-- Interest profiles
+-- Time-decayed keyword weights per user, updated as views, favorites and preferences arrive.
+-- Apply once on databases created before this table was added to init.sql.
+
+USE castor_db;
+
+CREATE TABLE IF NOT EXISTS user_interest_terms (
+    user_id INT NOT NULL,
+    term VARCHAR(64) NOT NULL,
+    weight DOUBLE NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_id, term),
+    INDEX idx_user_weight (user_id, weight),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
@@ -0,0 +1,8 @@
+-- Watched-video lookups
+-- Covers SELECT DISTINCT video_id ... WHERE user_id, which loads the set of videos excluded from recommendations.
+-- Apply once on databases created before this index was added to init.sql.
+
+USE castor_db;
+
+ALTER TABLE view_history
+    ADD INDEX idx_user_video (user_id, video_id);
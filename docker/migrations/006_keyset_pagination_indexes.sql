@@ -0,0 +1,18 @@
+-- Keyset pagination indexes
+-- Back the (name, id), (user_id, added_at), (user_id, analyzed_at) and (user_id, viewed_at) seeks
+-- used by paginated listings and ranged history reads.
+-- Apply once on databases created before these indexes were added to init.sql.
+
+USE castor_db;
+
+ALTER TABLE users
+    ADD INDEX idx_name_id (name, id);
+
+ALTER TABLE favorite_videos
+    ADD INDEX idx_user_added_at (user_id, added_at);
+
+ALTER TABLE trend_analysis
+    ADD INDEX idx_user_analyzed_at (user_id, analyzed_at);
+
+ALTER TABLE view_history
+    ADD INDEX idx_user_viewed_at (user_id, viewed_at);
@@ -0,0 +1,10 @@
+-- Trending cache fetch time
+-- Every row of trending_videos_cache records the fetch that wrote it; a chart is only served from a single fetch.
+-- Apply once on databases created before this column was added to init.sql.
+
+USE castor_db;
+
+DELETE FROM trending_videos_cache;
+
+ALTER TABLE trending_videos_cache
+    ADD COLUMN fetched_at DATETIME(6) NOT NULL AFTER rank_position;